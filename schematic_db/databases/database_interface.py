@@ -83,6 +83,18 @@ class Database(ABC):
             table_schema (TableSchema): The schema for the table being added
         """
 
+    def add_tables(self, table_schemas: list[TableSchema]) -> None:
+        """Adds a list of tables to the schema
+
+        Subclasses that can batch their DDL should override this to create all
+         tables in one round-trip.
+
+        Args:
+            table_schemas (list[TableSchema]): The schemas for the tables being added
+        """
+        for table_schema in table_schemas:
+            self.add_table(table_schema)
+
     @abstractmethod
     def drop_table(self, table_name: str) -> None:
         """Drops a table from the schema
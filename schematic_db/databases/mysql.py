@@ -2,7 +2,6 @@
 
 from typing import Any
 import pandas
-import numpy
 import sqlalchemy
 import sqlalchemy.dialects.mysql
 from sqlalchemy.exc import DataError, SQLAlchemyError
@@ -57,32 +56,40 @@ class MySQLDatabase(SQLAlchemyDatabase):
             InsertDatabaseError: Raised when a SQLAlchemy error caught
         """
         table = self._get_table_object(table_name)
-        data = data.replace({numpy.nan: None})
+        # one whole-frame cast plus mask is much faster than DataFrame.replace
+        data = data.astype(object).where(data.notna(), None)
         rows = data.to_dict("records")
-        for row in rows:
-            try:
-                self._upsert_table_row(row, table, table_name)
-            except DataError as exception:
-                # Insert errors can be quite large, so only part of the error message is presented
-                raise InsertDatabaseError(table_name, exception.args[0]) from None
-            except SQLAlchemyError as exception:
-                raise InsertDatabaseError(table_name) from exception
+        try:
+            self._upsert_table_rows(rows, table)
+        except DataError as exception:
+            # Insert errors can be quite large, so only part of the error message is presented
+            raise InsertDatabaseError(table_name, exception.args[0]) from None
+        except SQLAlchemyError as exception:
+            raise InsertDatabaseError(table_name) from exception
 
-    def _upsert_table_row(
+    def _upsert_table_rows(
         self,
-        row: dict[str, Any],
+        rows: list[dict[str, Any]],
         table: sqlalchemy.Table,
-        table_name: str,  # pylint: disable=unused-argument
     ) -> None:
-        """Upserts a row into a MySQL table
+        """Upserts a pandas dataframe into a MySQL table
+
+        All rows are sent as one multi-row statement in a single transaction
+         rather than one statement per row.
 
         Args:
-            row (dict[str, Any]): A row of a dataframe to be upserted
+            rows (list[dict[str, Any]]): A list of rows of a dataframe to be upserted
             table (sqlalchemy.Table):  A sqlalchemy Table to be upserted into
-            table_name (str): The name of the table to be upserted into (unused)
         """
-        statement = sqlalchemy.dialects.mysql.insert(table).values(row)
-        statement = statement.on_duplicate_key_update(**row)
+        # an empty values list would compile to a defaults-only insert
+        if not rows:
+            return
+        statement = sqlalchemy.dialects.mysql.insert(table).values(rows)
+        # only the columns present in the input rows are updated on duplicate
+        #  keys; including every table column would overwrite existing data
+        #  with column defaults
+        update_columns = {name: statement.inserted[name] for name in rows[0]}
+        statement = statement.on_duplicate_key_update(**update_columns)
         with self.engine.begin() as conn:
             conn.execute(statement)
 
@@ -1,7 +1,6 @@
 """Represents a Postgres database."""
 
 from typing import Any
-import numpy
 import pandas
 import sqlalchemy
 import sqlalchemy.dialects.postgresql
@@ -55,7 +54,8 @@ class PostgresDatabase(SQLAlchemyDatabase):
             InsertDatabaseError: Raised when a SQLAlchemy error caught while tryign to do the upsert
         """
         table = self._get_table_object(table_name)
-        data = data.replace({numpy.nan: None})
+        # one whole-frame cast plus mask is much faster than DataFrame.replace
+        data = data.astype(object).where(data.notna(), None)
         rows = data.to_dict("records")
         table_schema = self._get_current_metadata().tables[table_name]
         primary_key = inspect(table_schema).primary_key.columns.values()[0].name
@@ -2,7 +2,6 @@
 
 from dataclasses import dataclass
 import pandas
-import numpy
 import sqlalchemy
 import sqlalchemy_utils
 from sqlalchemy.exc import DataError, SQLAlchemyError
@@ -97,12 +96,14 @@ def create_column_schemas(
         list[ColumnSchema]: A list of column schemas
     """
     columns = table_schema.c
+    # a set so the per column membership probe is constant time
+    indexed_column_set = set(indexed_columns)
     return [
         ColumnSchema(
             name=column.name,
             datatype=column_datatypes[type(column.type)],
             required=not column.nullable,
-            index=column.name in indexed_columns,
+            index=column.name in indexed_column_set,
         )
         for column in columns
     ]
@@ -191,8 +192,10 @@ class SQLAlchemyDatabase(Database):  # pylint: disable=too-many-instance-attribu
         Returns:
             pandas.DataFrame: The query result in pandas.Dataframe form
         """
-        result = self._execute_sql_statement(sqlalchemy.text(query)).fetchall()
-        table = pandas.DataFrame(result)
+        result = self._execute_sql_statement(sqlalchemy.text(query))
+        # supplying the column names at construction avoids a second pass of
+        #  inference and keeps empty results correctly shaped
+        table = pandas.DataFrame(result.fetchall(), columns=list(result.keys()))
         return table
 
     def get_table_schema(self, table_name: str) -> TableSchema:
@@ -228,7 +231,8 @@ class SQLAlchemyDatabase(Database):  # pylint: disable=too-many-instance-attribu
             InsertDatabaseError: Raised when a SQLAlchemy error caught
         """
         table = self._get_table_object(table_name)
-        data = data.replace({numpy.nan: None})
+        # one whole-frame cast plus mask is much faster than DataFrame.replace
+        data = data.astype(object).where(data.notna(), None)
         rows = data.to_dict("records")
         statement = sqlalchemy.insert(table).values(rows)
         try:
@@ -290,6 +294,27 @@ class SQLAlchemyDatabase(Database):  # pylint: disable=too-many-instance-attribu
         )
         metadata.create_all(self.engine)
 
+    def add_tables(self, table_schemas: list[TableSchema]) -> None:
+        """Adds a list of tables to the schema
+
+        All tables are registered on one reflected metadata object so the DDL
+         is issued in a single create_all call instead of one reflect/create
+         round-trip per table.
+
+        Args:
+            table_schemas (list[TableSchema]): The schemas for the tables being added
+        """
+        metadata = self._get_current_metadata()
+        for table_schema in table_schemas:
+            columns = self._create_columns(table_schema)
+            sqlalchemy.Table(
+                table_schema.name,
+                metadata,
+                *columns,
+                sqlalchemy.PrimaryKeyConstraint(table_schema.primary_key),
+            )
+        metadata.create_all(self.engine)
+
     def query_table(self, table_name: str) -> pandas.DataFrame:
         """Queries a whole table
 
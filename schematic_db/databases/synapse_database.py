@@ -1,6 +1,9 @@
 """SynapseDatabase"""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+import numpy as np
 import pandas as pd
 import synapseclient as sc  # type: ignore
 from schematic_db.db_schema.db_schema import (
@@ -11,6 +14,7 @@ from schematic_db.db_schema.db_schema import (
     ColumnDatatype,
 )
 from schematic_db.synapse.synapse import Synapse
+from schematic_db.utils.dataframe_utils import concat_tables
 from .database_interface import Database
 
 CONFIG_DATATYPES = {
@@ -95,16 +99,50 @@ class SynapseDatabaseUpdateTableError(Exception):
         )
 
 
-def create_foreign_key_annotation_string(key: ForeignKeySchema) -> str:
-    """Creates a string that will serve as a foreign key Synapse annotation
+def format_sql_value(value: object) -> str:
+    """Formats a key value as a literal for a Synapse SQL IN clause
+
+    Numeric values are emitted bare so they match INTEGER and DOUBLE typed
+     columns by value; everything else is quoted, with embedded single
+     quotes doubled so values containing quotes can't break the query.
 
     Args:
-        key (ForeignKeySchema): The foreign key to be turned into a string
+        value (object): A primary or foreign key value
 
     Returns:
-        str: The foreign key in string form.
+        str: The value as a SQL literal
     """
-    return f"{key.name};{key.foreign_table_name};{key.foreign_column_name}"
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(
+        value, bool
+    ):
+        return str(value)
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+# Synapse caps string annotation values at 500 characters, so the serialized
+#  foreign keys are split across multiple values and rejoined when read
+MAX_ANNOTATION_STRING_LENGTH = 500
+
+
+def create_foreign_keys_annotation(keys: list[ForeignKeySchema]) -> list[str]:
+    """Creates the JSON strings that will serve as the foreign keys Synapse annotation
+
+    The keys are serialized as one JSON document and split across as many
+     annotation values as needed to stay under Synapse's per-value length
+     limit; create_foreign_keys joins the values back together before parsing.
+
+    Args:
+        keys (list[ForeignKeySchema]): The foreign keys to be turned into strings
+
+    Returns:
+        list[str]: The foreign keys in JSON string form, split into chunks
+    """
+    document = json.dumps([key.get_column_dict() for key in keys])
+    return [
+        document[i : i + MAX_ANNOTATION_STRING_LENGTH]
+        for i in range(0, len(document), MAX_ANNOTATION_STRING_LENGTH)
+    ]
 
 
 def create_attribute_annotation_string(column_schema: ColumnSchema) -> str:
@@ -128,16 +166,25 @@ def create_foreign_keys(strings: list[str]) -> list[ForeignKeySchema]:
     Returns:
         list[ForeignKeySchema]: A list of ForeignKeySchemas
     """
-    if strings is None:
+    if not strings:
         return []
-    lists: list[list[str]] = [key.split(";") for key in strings]
+    # current format: one JSON document, possibly split across several values
+    #  to stay under Synapse's per-value length limit
+    if strings[0].lstrip().startswith("["):
+        return [
+            ForeignKeySchema(**key_dict) for key_dict in json.loads("".join(strings))
+        ]
+    # legacy format: one "name;foreign_table_name;foreign_column_name" string per key
+    parts = pd.Series(strings).str.split(";", n=2, expand=True)
     return [
         ForeignKeySchema(
-            name=key[0],
-            foreign_table_name=key[1],
-            foreign_column_name=key[2],
+            name=name,
+            foreign_table_name=foreign_table_name,
+            foreign_column_name=foreign_column_name,
+        )
+        for name, foreign_table_name, foreign_column_name in zip(
+            parts[0], parts[1], parts[2]
         )
-        for key in lists
     ]
 
 
@@ -150,15 +197,42 @@ def create_column_schemas(column_annotations: list[str]) -> list[ColumnSchema]:
     Returns:
         list[ColumnSchema]:  A list of ColumnSchemas
     """
-    column_lists = [att.split(";") for att in column_annotations]
+    if not column_annotations:
+        return []
+    parts = pd.Series(column_annotations).str.split(";", n=2, expand=True)
     return [
         ColumnSchema(
-            name=att[0], datatype=CONFIG_DATATYPES[att[1]], required=att[2] == "True"
+            name=name, datatype=CONFIG_DATATYPES[datatype], required=required == "True"
         )
-        for att in column_lists
+        for name, datatype, required in zip(parts[0], parts[1], parts[2])
     ]
 
 
+# column factories bound once at import instead of rebuilt per call
+SYNAPSE_COLUMN_FACTORIES = {
+    ColumnDatatype.TEXT: partial(sc.Column, columnType="LARGETEXT"),
+    ColumnDatatype.DATE: partial(sc.Column, columnType="DATE"),
+    ColumnDatatype.INT: partial(sc.Column, columnType="INTEGER"),
+    ColumnDatatype.FLOAT: partial(sc.Column, columnType="DOUBLE"),
+    ColumnDatatype.BOOLEAN: partial(sc.Column, columnType="BOOLEAN"),
+    ColumnDatatype.SYNAPSE_STRING: partial(sc.Column, columnType="STRING"),
+    ColumnDatatype.SYNAPSE_FILE_HANDLE_ID: partial(
+        sc.Column, columnType="FILEHANDLEID"
+    ),
+    ColumnDatatype.SYNAPSE_ENTITY_ID: partial(sc.Column, columnType="ENTITYID"),
+    ColumnDatatype.SYNAPSE_LINK: partial(sc.Column, columnType="LINK"),
+    ColumnDatatype.SYNAPSE_USER_ID: partial(sc.Column, columnType="USERID"),
+    ColumnDatatype.SYNAPSE_DATE_LIST: partial(sc.Column, columnType="DATE_LIST"),
+    ColumnDatatype.SYNAPSE_INT_LIST: partial(sc.Column, columnType="INTEGER_LIST"),
+    ColumnDatatype.SYNAPSE_BOOLEAN_LIST: partial(sc.Column, columnType="BOOLEAN_LIST"),
+    ColumnDatatype.SYNAPSE_STRING_LIST: partial(sc.Column, columnType="STRING_LIST"),
+    ColumnDatatype.SYNAPSE_ENTITY_ID_LIST: partial(
+        sc.Column, columnType="ENTITYID_LIST"
+    ),
+    ColumnDatatype.SYNAPSE_USER_ID_LIST: partial(sc.Column, columnType="USERID_LIST"),
+}
+
+
 def create_synapse_column(
     name: str,
     datatype: ColumnDatatype,
@@ -176,35 +250,7 @@ def create_synapse_column(
     Returns:
         sc.Column: A synapse column object
     """
-    datatypes = {
-        ColumnDatatype.TEXT: partial(sc.Column, columnType="LARGETEXT"),
-        ColumnDatatype.DATE: partial(sc.Column, columnType="DATE"),
-        ColumnDatatype.INT: partial(sc.Column, columnType="INTEGER"),
-        ColumnDatatype.FLOAT: partial(sc.Column, columnType="DOUBLE"),
-        ColumnDatatype.BOOLEAN: partial(sc.Column, columnType="BOOLEAN"),
-        ColumnDatatype.SYNAPSE_STRING: partial(sc.Column, columnType="STRING"),
-        ColumnDatatype.SYNAPSE_FILE_HANDLE_ID: partial(
-            sc.Column, columnType="FILEHANDLEID"
-        ),
-        ColumnDatatype.SYNAPSE_ENTITY_ID: partial(sc.Column, columnType="ENTITYID"),
-        ColumnDatatype.SYNAPSE_LINK: partial(sc.Column, columnType="LINK"),
-        ColumnDatatype.SYNAPSE_USER_ID: partial(sc.Column, columnType="USERID"),
-        ColumnDatatype.SYNAPSE_DATE_LIST: partial(sc.Column, columnType="DATE_LIST"),
-        ColumnDatatype.SYNAPSE_INT_LIST: partial(sc.Column, columnType="INTEGER_LIST"),
-        ColumnDatatype.SYNAPSE_BOOLEAN_LIST: partial(
-            sc.Column, columnType="BOOLEAN_LIST"
-        ),
-        ColumnDatatype.SYNAPSE_STRING_LIST: partial(
-            sc.Column, columnType="STRING_LIST"
-        ),
-        ColumnDatatype.SYNAPSE_ENTITY_ID_LIST: partial(
-            sc.Column, columnType="ENTITYID_LIST"
-        ),
-        ColumnDatatype.SYNAPSE_USER_ID_LIST: partial(
-            sc.Column, columnType="USERID_LIST"
-        ),
-    }
-    func = datatypes[datatype]
+    func = SYNAPSE_COLUMN_FACTORIES[datatype]
     return func(name=name, maximumSize=max_size, maximumListLength=max_list_length)
 
 
@@ -219,6 +265,11 @@ class SynapseDatabase(Database):
             project_id (str): A Synapse id for a project
         """
         self.synapse = Synapse(auth_token, project_id)
+        self.database_schema: DatabaseSchema | None = None
+
+    def _invalidate_database_schema(self) -> None:
+        """Clears the cached database schema after a schema changing operation"""
+        self.database_schema = None
 
     def query_table(self, table_name: str) -> pd.DataFrame:
         synapse_id = self.synapse.get_synapse_id_from_table_name(table_name)
@@ -227,13 +278,27 @@ class SynapseDatabase(Database):
 
     def drop_all_tables(self) -> None:
         database_schema = self.get_database_schema()
-        deps = {
-            table: database_schema.get_dependencies(table)
-            for table in database_schema.get_schema_names()
-        }
-        tables_with_no_deps = [key for key, value in deps.items() if value == []]
-        for table in tables_with_no_deps:
-            self._drop_table_and_dependencies(table, database_schema)
+        remaining = set(database_schema.get_schema_names())
+        # Tables are dropped in waves: a table is droppable once no remaining
+        #  table depends on it, and tables in the same wave are independent so
+        #  their HTTP calls are issued concurrently.
+        while remaining:
+            droppable = [
+                name
+                for name in remaining
+                if not any(
+                    dependent in remaining
+                    for dependent in database_schema.get_reverse_dependencies(name)
+                )
+            ]
+            if not droppable:
+                break
+            table_ids = [
+                self.synapse.get_synapse_id_from_table_name(name) for name in droppable
+            ]
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(self._drop_table, table_ids))
+            remaining.difference_update(droppable)
 
     def drop_table_and_dependencies(self, table_name: str) -> None:
         """Drops the table and any tables that depend on it.
@@ -284,6 +349,7 @@ class SynapseDatabase(Database):
         """
         table_id = self.synapse.get_synapse_id_from_table_name(table_name)
         self.synapse.delete_table(table_id)
+        self._invalidate_database_schema()
 
     def drop_table(self, table_name: str) -> None:
         database_schema = self.get_database_schema()
@@ -302,6 +368,7 @@ class SynapseDatabase(Database):
         self.synapse.delete_all_table_rows(table_id)
         self.synapse.delete_all_table_columns(table_id)
         self.synapse.clear_entity_annotations(table_id)
+        self._invalidate_database_schema()
 
     def execute_sql_query(
         self, query: str, include_row_data: bool = False
@@ -336,6 +403,41 @@ class SynapseDatabase(Database):
                     dependency=key.foreign_table_name,
                 )
 
+    def add_tables(self, table_schemas: list[TableSchema]) -> None:
+        """Adds a list of tables to the schema
+
+        Tables at the same depth in the dependency graph are independent of
+         each other, so each depth level is created concurrently; the levels
+         themselves run in order so foreign key targets always exist first.
+
+        Args:
+            table_schemas (list[TableSchema]): The schemas for the tables being added
+        """
+        schemas_by_name = {schema.name: schema for schema in table_schemas}
+        levels: dict[str, int] = {}
+
+        def get_level(name: str) -> int:
+            level = levels.get(name)
+            if level is None:
+                dependencies = [
+                    key.foreign_table_name
+                    for key in schemas_by_name[name].foreign_keys
+                    if key.foreign_table_name in schemas_by_name
+                ]
+                level = 1 + max(map(get_level, dependencies), default=-1)
+                levels[name] = level
+            return level
+
+        grouped_schemas: dict[int, list[TableSchema]] = {}
+        for schema in table_schemas:
+            grouped_schemas.setdefault(get_level(schema.name), []).append(schema)
+
+        for level in sorted(grouped_schemas):
+            level_schemas = grouped_schemas[level]
+            with ThreadPoolExecutor(max_workers=min(8, len(level_schemas))) as executor:
+                # list() propagates the first exception from the workers
+                list(executor.map(self.add_table, level_schemas))
+
     def add_table(self, table_schema: TableSchema) -> None:
         table_names = self.synapse.get_table_names()
         table_name = table_schema.name
@@ -371,23 +473,29 @@ class SynapseDatabase(Database):
         }
         annotations["primary_key"] = table_schema.primary_key
         if len(table_schema.foreign_keys) > 0:
-            foreign_key_strings = [
-                create_foreign_key_annotation_string(key)
-                for key in table_schema.foreign_keys
-            ]
-            annotations["foreign_keys"] = foreign_key_strings
+            annotations["foreign_keys"] = create_foreign_keys_annotation(
+                table_schema.foreign_keys
+            )
         self.synapse.set_entity_annotations(synapse_id, annotations)
+        self._invalidate_database_schema()
 
     def get_database_schema(self) -> DatabaseSchema:
         """Gets the schema of the synapse database.
+        The schema is cached so repeated calls, such as those made while deleting
+         rows across dependent tables, don't refetch every table's annotations.
 
         Returns:
             DatabaseSchema: The db schema
         """
-        table_names = self.synapse.get_table_names()
-        result_list = [self.get_table_schema(name) for name in table_names]
-        schema_list = [schema for schema in result_list if schema is not None]
-        return DatabaseSchema(schema_list)
+        if self.database_schema is None:
+            table_names = self.synapse.get_table_names()
+            # each table schema needs its own annotation fetch, so the
+            #  fetches are done concurrently
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                result_list = list(executor.map(self.get_table_schema, table_names))
+            schema_list = [schema for schema in result_list if schema is not None]
+            self.database_schema = DatabaseSchema(schema_list)
+        return self.database_schema
 
     def get_table_schema(self, table_name: str) -> TableSchema:
         """Creates a TableSchema if the table is annotated, otherwise None
@@ -444,8 +552,10 @@ class SynapseDatabase(Database):
             database_schema (DatabaseSchema): The schema for the database
         """
         primary_key = database_schema.get_schema_by_name(table_name).primary_key
+        # only the unique primary key values are needed for the recursion,
+        #  avoiding a one column dataframe copy per level
         self._delete_table_dependency_rows(
-            table_name, database_schema, data[[primary_key]]
+            table_name, database_schema, data[primary_key].dropna().unique()
         )
         self.synapse.delete_table_rows(table_id, data)
 
@@ -453,7 +563,7 @@ class SynapseDatabase(Database):
         self,
         table_name: str,
         database_schema: DatabaseSchema,
-        data: pd.DataFrame,
+        primary_key_values: np.ndarray,
     ) -> None:
         """Deletes rows from the tables that are dependant on the given table
 
@@ -461,7 +571,8 @@ class SynapseDatabase(Database):
             table_name (str): The name of the table whose reverse dependencies will have their rows
              deleted from
             database_schema (DatabaseSchema): The schema for the database
-            data (pd.DataFrame): A pandas.DataFrame, of just it's primary key.
+            primary_key_values (np.ndarray): The unique primary key values of the rows being
+             deleted from the table
         """
         reverse_dependencies = database_schema.get_reverse_dependencies(table_name)
         for rd_table_name in reverse_dependencies:
@@ -475,26 +586,31 @@ class SynapseDatabase(Database):
                 key for key in foreign_keys if key.foreign_table_name == table_name
             ][0]
 
-            # get the reverse dependency data with just its primary and foreign key
-            query = f"SELECT {primary_key}, {foreign_key.name} FROM {table_id}"
-            rd_data = self.execute_sql_query(query, include_row_data=True)
-
-            # merge the reverse dependency data with the input data
-            data = pd.merge(
-                rd_data,
-                data,
-                how="inner",
-                left_on=foreign_key.name,
-                right_on=foreign_key.foreign_column_name,
-                validate="many_to_one",
-            )
+            # get the reverse dependency rows whose foreign key matches the input keys,
+            #  chunking the IN clause to stay under Synapse query length limits
+            if len(primary_key_values) == 0:
+                continue
+            rd_data_list = []
+            for i in range(0, len(primary_key_values), 1000):
+                values = ", ".join(
+                    format_sql_value(value)
+                    for value in primary_key_values[i : i + 1000]
+                )
+                query = (
+                    f"SELECT {primary_key}, {foreign_key.name} FROM {table_id} "
+                    f"WHERE {foreign_key.name} IN ({values})"
+                )
+                rd_data_list.append(
+                    self.execute_sql_query(query, include_row_data=True)
+                )
+            rd_data = concat_tables(rd_data_list)
 
-            # if data has no rows continue to next reverse dependency
-            if len(data.index) == 0:
+            # if there are no matching rows continue to next reverse dependency
+            if len(rd_data.index) == 0:
                 continue
 
-            data = data[[primary_key, "ROW_ID", "ROW_VERSION"]]
-            self._delete_table_rows(rd_table_name, table_id, data, database_schema)
+            rd_data = rd_data[[primary_key, "ROW_ID", "ROW_VERSION"]]
+            self._delete_table_rows(rd_table_name, table_id, rd_data, database_schema)
 
     def insert_table_rows(self, table_name: str, data: pd.DataFrame) -> None:
         """Inserts rows into the given table
@@ -541,7 +657,7 @@ class SynapseDatabase(Database):
             InputDataframeMissingColumn: Raised when the input dataframe has
               no column that matches the primary key argument.
         """
-        if primary_key not in list(data.columns):
+        if primary_key not in data.columns:
             raise InputDataframeMissingColumn(
                 "Input dataframe missing primary key column.",
                 list(data.columns),
@@ -570,13 +686,23 @@ class SynapseDatabase(Database):
         Returns:
             pd.DataFrame: A dataframe with only rows where the primary key currently exists
         """
-        data = data[[primary_key]]
-        table = self.synapse.query_table(table_id, include_row_data=True)
-        table = table[["ROW_ID", "ROW_VERSION", primary_key]]
-        merged_table = pd.merge(
-            data, table, how="inner", on=primary_key, validate="one_to_one"
-        )
-        return merged_table
+        # the existence filter runs server side so only matching rows come back,
+        #  chunking the IN clause to stay under Synapse query length limits
+        input_keys = data[primary_key].dropna().unique()
+        if len(input_keys) == 0:
+            return pd.DataFrame(columns=["ROW_ID", "ROW_VERSION", primary_key])
+        table_list = []
+        for i in range(0, len(input_keys), 1000):
+            values = ", ".join(
+                format_sql_value(value) for value in input_keys[i : i + 1000]
+            )
+            query = (
+                f"SELECT {primary_key} FROM {table_id} "
+                f"WHERE {primary_key} IN ({values})"
+            )
+            table_list.append(self.execute_sql_query(query, include_row_data=True))
+        table = concat_tables(table_list)
+        return table[["ROW_ID", "ROW_VERSION", primary_key]]
 
     def _create_primary_key_table(
         self, table_id: str, primary_key: str
@@ -596,7 +722,7 @@ class SynapseDatabase(Database):
               matches the primary key argument.
         """
         table = self.synapse.query_table(table_id, include_row_data=True)
-        if primary_key not in list(table.columns):
+        if primary_key not in table.columns:
             raise InputDataframeMissingColumn(
                 "Synapse table missing primary key column",
                 list(table.columns),
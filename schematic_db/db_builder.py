@@ -55,7 +55,7 @@ class DBBuilder:  # pylint: disable=too-few-public-methods
             database_schema (DatabaseSchema): A generic schema for the database
         """
         logging.info("Building database")
-        for table_schema in database_schema.table_schemas:
-            logging.info(f"Adding table to database schema: {table_schema.name}")
-            self.db.add_table(table_schema)
+        table_names = [schema.name for schema in database_schema.table_schemas]
+        logging.info(f"Adding tables to database schema: {table_names}")
+        self.db.add_tables(database_schema.table_schemas)
         logging.info("Database built")
@@ -45,9 +45,16 @@ class DBQueryer:
         Args:
             csv_path (str): A path to a csv file.
         """
-        csv = pd.read_csv(csv_path)
-        for _, row in csv.iterrows():
-            self.store_query_result(row["query"], row["table_name"])
+        # the csv is read in chunks so memory stays bounded however many queries it holds
+        with pd.read_csv(
+            csv_path, usecols=["query", "table_name"], dtype=str, chunksize=1024
+        ) as reader:
+            for chunk in reader:
+                # zip over the underlying arrays to avoid materializing a Series per row
+                for query, table_name in zip(
+                    chunk["query"].to_numpy(), chunk["table_name"].to_numpy()
+                ):
+                    self.store_query_result(query, table_name)
 
     def store_query_result(self, query: str, table_name: str) -> None:
         """Stores the result of a query
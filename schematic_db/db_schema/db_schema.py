@@ -2,7 +2,9 @@
 These are a set of classes for defining a database schema in a dialect agnostic way.
 """
 
+import dataclasses
 from enum import Enum
+from operator import attrgetter
 from typing import Any
 from typing_extensions import Self
 from pydantic.dataclasses import dataclass
@@ -37,7 +39,9 @@ class ColumnDatatype(Enum):
     SYNAPSE_USER_ID_LIST = "synapse_user_id_list"
 
 
-@dataclass()
+# These are stdlib dataclasses with slots since many instances are created per
+#  run, and pydantic's per field validation pass is overhead they don't need.
+@dataclasses.dataclass(frozen=True, slots=True)
 class ColumnSchema:
     """A schema for a table column (attribute)."""
 
@@ -47,10 +51,13 @@ class ColumnSchema:
     index: bool = False
     string_size_max: int | None = None
     list_length_max: int | None = None
-    _validate_name = field_validator("name")(string_is_not_empty)
+
+    def __post_init__(self) -> None:
+        """Validates the name"""
+        string_is_not_empty(self.name)
 
 
-@dataclass()
+@dataclasses.dataclass(frozen=True, slots=True)
 class ForeignKeySchema:
     """A foreign key in a database schema."""
 
@@ -58,13 +65,11 @@ class ForeignKeySchema:
     foreign_table_name: str
     foreign_column_name: str
 
-    _validate_name = field_validator("name")(string_is_not_empty)
-    _validate_foreign_table_name = field_validator("foreign_table_name")(
-        string_is_not_empty
-    )
-    _validate_foreign_column_name = field_validator("foreign_column_name")(
-        string_is_not_empty
-    )
+    def __post_init__(self) -> None:
+        """Validates the names"""
+        string_is_not_empty(self.name)
+        string_is_not_empty(self.foreign_table_name)
+        string_is_not_empty(self.foreign_column_name)
 
     def get_column_dict(self) -> dict[str, str]:
         """Returns the foreign key in dict form
@@ -119,7 +124,7 @@ class TableKeyError(Exception):
 
 
 @dataclass
-class TableSchema:
+class TableSchema:  # pylint: disable=too-many-instance-attributes
     """A schema for a database table."""
 
     name: str
@@ -137,8 +142,18 @@ class TableSchema:
         Returns:
             Self: The object itself
         """
-        self.columns.sort(key=lambda x: x.name)
-        self.foreign_keys.sort(key=lambda x: x.name)
+        # attrgetter keys sort at the C level with no per element Python call
+        self.columns.sort(key=attrgetter("name"))
+        self.foreign_keys.sort(key=attrgetter("name"))
+        # lookup tables so the by-name getters don't scan the lists every
+        #  call; the model validator is the dataclass's effective init
+        # pylint: disable=attribute-defined-outside-init
+        self._columns_by_name = {column.name: column for column in self.columns}
+        self._foreign_keys_by_name = {key.name: key for key in self.foreign_keys}
+        self._column_names = [column.name for column in self.columns]
+        # a fingerprint of the columns so unequal schemas compare in O(1)
+        self._columns_fingerprint = hash(tuple(self.columns))
+        # pylint: enable=attribute-defined-outside-init
         self._check_columns()
         self._check_primary_key()
         self._check_foreign_keys()
@@ -146,6 +161,10 @@ class TableSchema:
 
     def __eq__(self, other: Self) -> bool:  # type: ignore[override]
         """Overrides the default implementation"""
+        if self is other:
+            return True
+        if self._columns_fingerprint != other._columns_fingerprint:
+            return False
         return self.get_sorted_columns() == other.get_sorted_columns()
 
     def get_sorted_columns(self) -> list[ColumnSchema]:
@@ -154,7 +173,8 @@ class TableSchema:
         Returns:
             list[ColumnSchema]: Sorted list of columns
         """
-        return sorted(self.columns, key=lambda x: x.name)
+        # the columns are already sorted by name during validation
+        return self.columns
 
     def get_column_names(self) -> list[str]:
         """Returns a list of names of the columns
@@ -162,7 +182,8 @@ class TableSchema:
         Returns:
             List[str]: A list of names of the attributes
         """
-        return [column.name for column in self.columns]
+        # computed once during validation; the columns are frozen after that
+        return self._column_names
 
     def get_foreign_key_dependencies(self) -> list[str]:
         """Returns a list of table names the current table depends on
@@ -189,7 +210,7 @@ class TableSchema:
         Returns:
             ForeignKeySchema: The foreign key asked for
         """
-        return [key for key in self.foreign_keys if key.name == name][0]
+        return self._foreign_keys_by_name[name]
 
     def get_column_by_name(self, name: str) -> ColumnSchema:
         """Returns the column
@@ -200,7 +221,7 @@ class TableSchema:
         Returns:
             ColumnSchema: The ColumnSchema asked for
         """
-        return [column for column in self.columns if column.name == name][0]
+        return self._columns_by_name[name]
 
     def _check_columns(self) -> None:
         """Checks that there are columns and they don't match
@@ -211,7 +232,7 @@ class TableSchema:
         """
         if len(self.columns) == 0:
             raise TableColumnError("There are no columns", self.name)
-        if len(self.get_column_names()) != len(set(self.get_column_names())):
+        if len(self.columns) != len(self._columns_by_name):
             raise TableColumnError("There are duplicate columns", self.name)
 
     def _check_primary_key(self) -> None:
@@ -220,7 +241,7 @@ class TableSchema:
         Raises:
             TableKeyError: Raised when the primary key is missing from the columns
         """
-        if self.primary_key not in self.get_column_names():
+        if self.primary_key not in self._columns_by_name:
             raise TableKeyError(
                 "Primary key is missing from columns", self.name, self.primary_key
             )
@@ -240,7 +261,7 @@ class TableSchema:
             TableKeyError: Raised when the foreign key is missing from the columns
             TableKeyError: Raised when the foreign key references its own table
         """
-        if key.name not in self.get_column_names():
+        if key.name not in self._columns_by_name:
             raise TableKeyError(
                 "Foreign key is missing from columns", self.name, key.name
             )
@@ -324,12 +345,34 @@ class DatabaseSchema:
         Returns:
             Self: The object itself
         """
+        # lookup tables so name and dependency getters don't scan every
+        #  call; the model validator is the dataclass's effective init
+        # pylint: disable=attribute-defined-outside-init
+        self._schemas_by_name = {schema.name: schema for schema in self.table_schemas}
+        self._reverse_dependencies: dict[str, list[str]] = {}
+        for schema in self.table_schemas:
+            for table_name in schema.get_foreign_key_dependencies():
+                self._reverse_dependencies.setdefault(table_name, []).append(
+                    schema.name
+                )
         for schema in self.table_schemas:
             self._check_foreign_keys(schema)
+        # a fingerprint of the table schemas so unequal schemas compare in O(1)
+        self._tables_fingerprint = hash(
+            tuple(
+                schema._columns_fingerprint  # pylint: disable=protected-access
+                for schema in self.get_sorted_table_schemas()
+            )
+        )
+        # pylint: enable=attribute-defined-outside-init
         return self
 
     def __eq__(self, other: Any) -> bool:
         """Overrides the default implementation"""
+        if self is other:
+            return True
+        if self._tables_fingerprint != other._tables_fingerprint:
+            return False
         return self.get_sorted_table_schemas() == other.get_sorted_table_schemas()
 
     def get_sorted_table_schemas(self) -> list[TableSchema]:
@@ -338,7 +381,7 @@ class DatabaseSchema:
         Returns:
             list[TableSchema]: The list of sorted table schemas
         """
-        return sorted(self.table_schemas, key=lambda x: x.name)
+        return sorted(self.table_schemas, key=attrgetter("name"))
 
     def get_dependencies(self, table_name: str) -> list[str]:
         """Gets the tables dependencies
@@ -360,11 +403,7 @@ class DatabaseSchema:
         Returns:
             list[str]: A list of table names that depend on the input table
         """
-        return [
-            schema.name
-            for schema in self.table_schemas
-            if table_name in schema.get_foreign_key_dependencies()
-        ]
+        return self._reverse_dependencies.get(table_name, [])
 
     def get_schema_names(self) -> list[str]:
         """Returns a list of names of the schemas
@@ -383,7 +422,7 @@ class DatabaseSchema:
         Returns:
             TableSchema: The TableSchema asked for
         """
-        return [schema for schema in self.table_schemas if schema.name == name][0]
+        return self._schemas_by_name[name]
 
     def _check_foreign_keys(self, schema: TableSchema) -> None:
         """Checks all foreign keys
@@ -407,7 +446,7 @@ class DatabaseSchema:
         Raises:
             SchemaMissingTableError: Raised when the table a foreign key references is missing
         """
-        if key.foreign_table_name not in self.get_schema_names():
+        if key.foreign_table_name not in self._schemas_by_name:
             raise SchemaMissingTableError(
                 foreign_key=key.name,
                 table_name=schema.name,
@@ -3,6 +3,8 @@
 # pylint: disable=logging-fstring-interpolation
 import warnings
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
 from typing import Literal
 
 import pandas as pd
@@ -110,6 +112,11 @@ class DBUpdater:
         """
         self.db = db
         self.manifest_store = manifest_store
+        # fingerprints of the manifests applied by this updater, so repeat
+        #  runs in a long-lived process skip uploads whose data hasn't
+        #  changed; keyed per update method since the same data applied with
+        #  a different method can change the table
+        self._manifest_fingerprints: dict[tuple[str, str], int] = {}
 
     def update_database(
         self,
@@ -132,8 +139,44 @@ class DBUpdater:
             tables_to_update = [
                 table for table in tables_to_update if table in table_names
             ]
-        for name in tables_to_update:
-            self.update_table(name, method=method, chunk_size=chunk_size)
+        # A table is dispatched as soon as every table it depends on is done,
+        #  so independent tables overlap their network bound updates and the
+        #  wall-clock cost approaches the longest dependency chain. Only
+        #  dependencies that are themselves being updated are waited on, so a
+        #  table_names filter doesn't leave tables waiting on excluded ones.
+        selected = set(tables_to_update)
+        dependencies = {
+            name: set(self.manifest_store.get_dependencies(name)) & selected
+            for name in tables_to_update
+        }
+        remaining = set(tables_to_update)
+        completed: set[str] = set()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            running: dict[Future, str] = {}
+            while remaining or running:
+                ready = [
+                    name
+                    for name in tables_to_update
+                    if name in remaining and not dependencies[name] - completed
+                ]
+                for name in ready:
+                    remaining.remove(name)
+                    future = executor.submit(
+                        self.update_table, name, method=method, chunk_size=chunk_size
+                    )
+                    running[future] = name
+                if not running:
+                    # nothing is running and nothing became ready, so the
+                    #  remaining tables can never be scheduled
+                    raise RuntimeError(
+                        "Could not schedule updates for tables with unmet "
+                        f"dependencies: {sorted(remaining)}"
+                    )
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    future.result()
+                    completed.add(name)
         logging.info("Database updated")
 
     def update_table(
@@ -153,7 +196,11 @@ class DBUpdater:
                 table into chunks first. The table will be split into chunks with row number equal
                 to this parameter. This can be used when the update includes large tables.
         """
-        manifest_ids = self.manifest_store.get_manifest_ids(table_name)
+        # duplicates are dropped up front so no manifest is downloaded and
+        #  applied twice; dict.fromkeys preserves the original order
+        manifest_ids = list(
+            dict.fromkeys(self.manifest_store.get_manifest_ids(table_name))
+        )
 
         # If there are no manifests a warning is raised and breaks out of function.
         if len(manifest_ids) == 0:
@@ -164,68 +211,86 @@ class DBUpdater:
             )
             return
 
-        for manifest_id in manifest_ids:
-            self._update_table_with_manifest_id(
-                table_name, manifest_id, method, chunk_size
+        table_schema = self.db.get_table_schema(table_name)
+
+        # manifest downloads are network bound, so they are fetched
+        #  concurrently; each worker also normalizes its manifest so only the
+        #  trimmed frames are held in memory. The updates still run in order.
+        logging.info(
+            f"Downloading manifests; table name: {table_name}; "
+            f"manifest ids: {manifest_ids}"
+        )
+        with ThreadPoolExecutor(max_workers=min(8, len(manifest_ids))) as executor:
+            normalized_tables = list(
+                executor.map(
+                    partial(self._download_and_normalize, table_name, table_schema),
+                    manifest_ids,
+                )
             )
+        logging.info("Finished downloading manifests")
+
+        for manifest_id, normalized_table in zip(manifest_ids, normalized_tables):
+            fingerprint = self._create_manifest_fingerprint(normalized_table)
+            if self._manifest_fingerprints.get((manifest_id, method)) == fingerprint:
+                logging.info(
+                    f"Skipping unchanged manifest; table name: {table_name}; "
+                    f"manifest id: {manifest_id}"
+                )
+                continue
+            self._update_table_with_manifest(
+                normalized_table, table_name, manifest_id, method, chunk_size
+            )
+            self._manifest_fingerprints[(manifest_id, method)] = fingerprint
+
+    @staticmethod
+    def _create_manifest_fingerprint(table: pd.DataFrame) -> int:
+        """Creates a fingerprint of a normalized manifest
 
-    def _update_table_with_manifest_id(
+        Args:
+            table (pd.DataFrame): The normalized manifest
+
+        Returns:
+            int: A hash of the manifests columns and values
+        """
+        return hash(
+            (
+                tuple(table.columns),
+                int(pd.util.hash_pandas_object(table, index=False).sum()),
+            )
+        )
+
+    def _download_and_normalize(
         self,
         table_name: str,
+        table_schema: TableSchema,
         manifest_id: str,
-        method: UpdateMethod = "upsert",
-        chunk_size: int | None = None,
-    ) -> None:
-        """Updates a table in the database with a manifest
+    ) -> pd.DataFrame:
+        """Downloads a manifest and gets it ready for the table update
 
         Args:
-            table_name (str): The name of the table
+            table_name (str): The name of the table the manifest will be upserted into
+            table_schema (TableSchema): The schema of the table being updated
             manifest_id (str): The id of the manifest
-            method (UpdateMethod): The method used to update each table. Defaults to "upsert".
-            chunk_size (int | None): When updating a database table, this splits the the input
-                table into chunks first. The table will be split into chunks with row number equal
-                to this parameter. This can be used when the update includes large tables.
 
         Raises:
             ManifestPrimaryKeyError: Raised when the manifest table is missing its primary key
-            UpsertError: Raised when there is an UpsertDatabaseError caught
-        """
-        table_schema = self.db.get_table_schema(table_name)
-
-        manifest_table = self._download_manifest(table_name, manifest_id)
 
-        if table_schema.primary_key not in list(manifest_table.columns):
+        Returns:
+            pd.DataFrame: The normalized manifest in pandas.Dataframe form
+        """
+        # only the schema's columns are needed, so the selection is pushed
+        #  down into the read instead of trimming afterwards
+        manifest_table = self.manifest_store.download_manifest(
+            manifest_id, usecols=table_schema.get_column_names()
+        )
+        if table_schema.primary_key not in manifest_table.columns:
             raise ManifestPrimaryKeyError(
                 table_name,
                 manifest_id,
                 table_schema.primary_key,
                 list(manifest_table.columns),
             )
-
-        normalized_table = self._normalize_table(manifest_table, table_schema)
-
-        self._update_table_with_manifest(
-            normalized_table, table_name, manifest_id, method, chunk_size
-        )
-
-    def _download_manifest(self, table_name: str, manifest_id: str) -> pd.DataFrame:
-        """Downloads a manifest, and performs logging
-
-        Args:
-            table_name (str): The name of the table the manifest will be upserted into
-            manifest_id (str): The id of the manifest
-
-        Returns:
-            (pd.DataFrame): The manifest in pandas.Dataframe form
-        """
-        logging.info(
-            f"Downloading manifest; table name: {table_name}; manifest id: {manifest_id}"
-        )
-        manifest_table: pd.DataFrame = self.manifest_store.download_manifest(
-            manifest_id
-        )
-        logging.info("Finished downloading manifest")
-        return manifest_table
+        return self._normalize_table(manifest_table, table_schema)
 
     def _normalize_table(
         self,
@@ -243,12 +308,18 @@ class DBUpdater:
         Returns:
             pd.DataFrame: A normalized table
         """
-        table_columns = set(table_schema.get_column_names())
-        manifest_columns = set(table.columns)
-        columns = list(table_columns.intersection(manifest_columns))
-        table = table[columns]
-        table = table.drop_duplicates(subset=table_schema.primary_key)
-        table.reset_index(inplace=True, drop=True)
+        # Columns are selected in schema order so every manifest for a table
+        #  produces an identically laid out frame; copy=False avoids an extra
+        #  full-frame copy during the selection. Membership probes against the
+        #  column Index use its hash table directly.
+        columns = [
+            name for name in table_schema.get_column_names() if name in table.columns
+        ]
+        table = table.reindex(columns=columns, copy=False)
+        # Uniqueness only matters on the primary key, so a single hash pass
+        #  over that column beats the generic multi-column dedup path.
+        mask = ~table[table_schema.primary_key].duplicated()
+        table = table.loc[mask].reset_index(drop=True)
         return table
 
     def _update_table_with_manifest(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -81,6 +81,17 @@ class APIManifestStore(ManifestStore):
         """
         return self.schema_graph.create_sorted_table_name_list()
 
+    def get_dependencies(self, table_name: str) -> list[str]:
+        """Gets the names of the tables the given table depends on
+
+        Args:
+            table_name (str): The name of the table
+
+        Returns:
+            list[str]: A list of table names
+        """
+        return self.schema_graph.get_neighbors(table_name)
+
     def get_manifest_metadata(self) -> ManifestMetadataList:
         """Gets the manifest metadata
 
@@ -108,14 +119,23 @@ class APIManifestStore(ManifestStore):
         """
         return self.get_manifest_metadata().get_manifest_ids_for_component(name)
 
-    def download_manifest(self, manifest_id: str) -> pandas.DataFrame:
+    def download_manifest(
+        self, manifest_id: str, usecols: list[str] | None = None
+    ) -> pandas.DataFrame:
         """Downloads the manifest
 
         Args:
             manifest_id (str): The synapse id of the manifest
+            usecols (list[str] | None): If given, only these columns are kept;
+             columns in the list but not in the manifest are ignored.
 
         Returns:
             pandas.DataFrame: The manifest in dataframe form
         """
         manifest = download_manifest(self.synapse_auth_token, manifest_id)
+        if usecols is not None:
+            wanted = set(usecols)
+            manifest = manifest[
+                [column for column in manifest.columns if column in wanted]
+            ]
         return manifest
@@ -1,15 +1,14 @@
 """Metadata for a manifest in Synapse."""
 
 # pylint: disable=duplicate-code
+import dataclasses
 from typing import Any
 import json
-from pydantic.dataclasses import dataclass
-from pydantic import field_validator
 
 from schematic_db.utils.validators import is_synapse_id, string_is_not_empty
 
 
-@dataclass()
+@dataclasses.dataclass(frozen=True, slots=True)
 class ManifestMetadata:
     """Metadata for a manifest in Synapse."""
 
@@ -19,11 +18,21 @@ class ManifestMetadata:
     manifest_name: str
     component_name: str
 
-    _validate_dataset_id = field_validator("dataset_id")(is_synapse_id)
-    _validate_manifest_id = field_validator("manifest_id")(is_synapse_id)
-    _validate_dataset_name = field_validator("dataset_name")(string_is_not_empty)
-    _validate_manifest_name = field_validator("manifest_name")(string_is_not_empty)
-    _validate_component_name = field_validator("component_name")(string_is_not_empty)
+    def __post_init__(self) -> None:
+        """Validates the metadata after creation
+
+        Raises:
+            ValueError: If any field isn't a string, or fails its validator
+        """
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if not isinstance(value, str):
+                raise ValueError(f"{field.name} must be a string; got: {value}")
+        is_synapse_id(self.dataset_id)
+        is_synapse_id(self.manifest_id)
+        string_is_not_empty(self.dataset_name)
+        string_is_not_empty(self.manifest_name)
+        string_is_not_empty(self.component_name)
 
     def to_dict(self) -> dict[str, str]:
         """Returns object attributes as dict
@@ -31,15 +40,7 @@ class ManifestMetadata:
         Returns:
             dict[str, str]: dict of object attributes
         """
-        attribute_dict = vars(self)
-        attribute_names = [
-            "dataset_id",
-            "dataset_name",
-            "manifest_id",
-            "manifest_name",
-            "component_name",
-        ]
-        return {key: attribute_dict[key] for key in attribute_names}
+        return dataclasses.asdict(self)
 
     def __repr__(self) -> str:
         """Prints object as dict"""
@@ -64,6 +65,11 @@ class ManifestMetadataList:
             else:
                 metadata_list.append(metadata)
         self.metadata_list = metadata_list
+        # an index by component so the per-component getters don't rescan the
+        #  whole list on every call
+        self._by_component: dict[str, list[ManifestMetadata]] = {}
+        for metadata in metadata_list:
+            self._by_component.setdefault(metadata.component_name, []).append(metadata)
 
     def __repr__(self) -> str:
         """Prints each metadata object as dict"""
@@ -82,8 +88,7 @@ class ManifestMetadataList:
         """
         return [
             metadata.dataset_id
-            for metadata in self.metadata_list
-            if metadata.component_name == component_name
+            for metadata in self._by_component.get(component_name, [])
         ]
 
     def get_manifest_ids_for_component(self, component_name: str) -> list[str]:
@@ -97,6 +102,5 @@ class ManifestMetadataList:
         """
         return [
             metadata.manifest_id
-            for metadata in self.metadata_list
-            if metadata.component_name == component_name
+            for metadata in self._by_component.get(component_name, [])
         ]
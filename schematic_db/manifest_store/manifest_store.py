@@ -5,6 +5,7 @@ The interface is used to interact with manifests
 
 # pylint: disable=duplicate-code
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 import pandas
 from pydantic.dataclasses import dataclass
 from pydantic import field_validator
@@ -55,6 +56,17 @@ class ManifestStore(ABC):
             list[str]: A list of tables names
         """
 
+    @abstractmethod
+    def get_dependencies(self, table_name: str) -> list[str]:
+        """Gets the names of the tables the given table depends on
+
+        Args:
+            table_name (str): The name of the table
+
+        Returns:
+            list[str]: A list of table names
+        """
+
     @abstractmethod
     def get_manifest_metadata(self) -> ManifestMetadataList:
         """Gets the current objects manifest metadata."""
@@ -71,12 +83,39 @@ class ManifestStore(ABC):
         """
 
     @abstractmethod
-    def download_manifest(self, manifest_id: str) -> pandas.DataFrame:
+    def download_manifest(
+        self, manifest_id: str, usecols: list[str] | None = None
+    ) -> pandas.DataFrame:
         """Downloads the manifest
 
         Args:
             manifest_id (str): The synapse id of the manifest
+            usecols (list[str] | None): If given, only these columns are kept;
+             columns in the list but not in the manifest are ignored.
 
         Returns:
             pandas.DataFrame: The manifest in dataframe form
         """
+
+    def download_manifests(
+        self, manifest_ids: list[str], max_workers: int = 8
+    ) -> list[pandas.DataFrame]:
+        """Downloads a list of manifests
+
+        Each download is a blocking network call, so they are made
+         concurrently. The result order matches the input order.
+
+        Args:
+            manifest_ids (list[str]): The synapse ids of the manifests
+            max_workers (int): The maximum number of concurrent downloads,
+             capping the load put on the backing service. Defaults to 8.
+
+        Returns:
+            list[pandas.DataFrame]: The manifests in dataframe form
+        """
+        if not manifest_ids:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(manifest_ids))
+        ) as executor:
+            return list(executor.map(self.download_manifest, manifest_ids))
@@ -2,8 +2,8 @@
 A config for database specific items
 """
 
+import dataclasses
 from typing import Any, Optional
-from pydantic.dataclasses import dataclass
 from schematic_db.db_schema.db_schema import (
     ForeignKeySchema,
     ColumnDatatype,
@@ -30,7 +30,7 @@ DATATYPES = {
 }
 
 
-@dataclass()
+@dataclasses.dataclass(frozen=True, slots=True)
 class ColumnConfig:
     """
     A config for a table column (attribute).
@@ -81,6 +81,7 @@ class TableConfig:  # pylint: disable=too-few-public-methods
             ]
         if columns is None:
             self.columns = None
+            self._columns_by_name: dict[str, ColumnConfig] = {}
         else:
             self.columns = [
                 ColumnConfig(
@@ -91,6 +92,7 @@ class TableConfig:  # pylint: disable=too-few-public-methods
                 )
                 for column in columns
             ]
+            self._columns_by_name = {column.name: column for column in self.columns}
 
 
 class DatabaseConfig:
@@ -102,6 +104,7 @@ class DatabaseConfig:
         """
         self.tables: list[TableConfig] = [TableConfig(**table) for table in tables]
         self._check_table_names()
+        self._tables_by_name = {table.name: table for table in self.tables}
 
     def get_primary_key(self, table_name: str) -> str | None:
         """Gets the primary key for an table
@@ -149,13 +152,11 @@ class DatabaseConfig:
         Returns:
             Optional[list[ColumnSchema]]: The list of columns
         """
-        columns = self.get_columns(table_name)
-        if columns is None:
-            return None
-        columns = [column for column in columns if column.name == column_name]
-        if len(columns) == 0:
+        table = self._get_table_by_name(table_name)
+        if table is None:
             return None
-        return columns[0]
+        # pylint: disable=protected-access
+        return table._columns_by_name.get(column_name)
 
     def _get_table_by_name(self, table_name: str) -> Optional[TableConfig]:
         """Gets the config for the table if it exists
@@ -166,10 +167,7 @@ class DatabaseConfig:
         Returns:
             Optional[TableConfig]: The config for the table if it exists
         """
-        tables = [table for table in self.tables if table.name == table_name]
-        if len(tables) == 0:
-            return None
-        return tables[0]
+        return self._tables_by_name.get(table_name)
 
     def _get_table_names(self) -> list[str]:
         """Gets the list of tables names in the config
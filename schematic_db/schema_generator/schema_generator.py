@@ -6,6 +6,7 @@ This class generates a generic database schema using the Schematic API
 # pylint: disable=duplicate-code
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pydantic.dataclasses import dataclass
 from pydantic import field_validator
 from schematic_db.db_schema.db_schema import (
@@ -137,6 +138,9 @@ class SchemaGenerator:
         self.display_label_type = config.display_label_type
         self.schema_graph = SchemaGraph(config.schema_url, config.display_label_type)
         self.database_schema: DatabaseSchema | None = None
+        # resolved primary keys by table name, shared between the table schema
+        #  and foreign key creation so each table is resolved only once
+        self._primary_keys: dict[str, str] = {}
 
     def get_database_schema(self) -> DatabaseSchema:
         """Gets the current database schema
@@ -153,11 +157,14 @@ class SchemaGenerator:
     def update_database_schema(self) -> None:
         """Updates the database schema."""
         table_names = self.schema_graph.create_sorted_table_name_list()
-        table_schemas = [
-            schema
-            for schema in [self._create_table_schema(name) for name in table_names]
-            if schema is not None
-        ]
+        # each table schema is built from independent schematic API calls, so
+        #  they are created concurrently; map preserves the sorted order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            table_schemas = [
+                schema
+                for schema in executor.map(self._create_table_schema, table_names)
+                if schema is not None
+            ]
         self.database_schema = DatabaseSchema(table_schemas)
 
     def _create_table_schema(self, table_name: str) -> TableSchema | None:
@@ -199,18 +206,49 @@ class SchemaGenerator:
         column_names = find_class_specific_properties(
             self.schema_url, table_name, self.display_label_type
         )
-        columns = [
-            self._create_column_schema(name, table_name) for name in column_names
-        ]
-        # Some Tables will not have any columns for various reasons
-        if not columns:
+        # Some Tables will not have any columns for various reasons; checking
+        #  the names up front skips the per-column schematic calls entirely
+        if not column_names:
             warnings.warn(
                 NoColumnsWarning(
                     f"Table {table_name} has no columns, and will be skipped."
                 )
             )
             return None
-        return columns
+        self._prefetch_column_data(column_names, table_name)
+        return [self._create_column_schema(name, table_name) for name in column_names]
+
+    def _prefetch_column_data(self, column_names: list[str], table_name: str) -> None:
+        """Warms the schematic API caches for a tables columns
+
+        The requirement and validation rule lookups are memoized, so fetching
+         them for every column concurrently up front turns the serial
+         round-trip per column in _create_column_schema into cache hits.
+
+        Args:
+            column_names (list[str]): The names of the columns to prefetch data for
+            table_name (str): The name of the table the columns belong to
+        """
+
+        def fetch(column_name: str) -> None:
+            column = self.database_config.get_column(table_name, column_name)
+            try:
+                if column is None or column.datatype is None:
+                    get_node_validation_rules(
+                        self.schema_url, column_name, self.display_label_type
+                    )
+                if column is None or column.required is None:
+                    is_node_required(
+                        self.schema_url, column_name, self.display_label_type
+                    )
+            except (SchematicAPIError, SchematicAPITimeoutError):
+                # errors are raised with column context by _create_column_schema
+                pass
+
+        if not column_names:
+            return
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(fetch, column_names))
 
     def _create_column_schema(self, column_name: str, table_name: str) -> ColumnSchema:
         """Creates a schema for  column
@@ -327,13 +365,14 @@ class SchemaGenerator:
         Returns:
             str: The primary key of the column
         """
-        # Attempt to get the primary key from the config
-        primary_key_attempt = self.database_config.get_primary_key(table_name)
-        # Check if the primary key is in the config, otherwise assume "id"
-        if primary_key_attempt is None:
-            return "id"
-
-        return primary_key_attempt
+        primary_key = self._primary_keys.get(table_name)
+        if primary_key is None:
+            # Attempt to get the primary key from the config
+            primary_key_attempt = self.database_config.get_primary_key(table_name)
+            # Check if the primary key is in the config, otherwise assume "id"
+            primary_key = "id" if primary_key_attempt is None else primary_key_attempt
+            self._primary_keys[table_name] = primary_key
+        return primary_key
 
     def _get_foreign_keys(self, table_name: str) -> list[ForeignKeySchema]:
         """Gets a list of foreign keys for an table in the database
@@ -381,10 +420,9 @@ class SchemaGenerator:
         #  foreign key would be "Patient_id"
         column_name = self._get_column_name(f"{foreign_table_name}_id")
 
-        # Attempt to get the foreign key  tables primary key.
-        # If the database config doesn't contain this information default to "id"
-        attempt = self.database_config.get_primary_key(foreign_table_name)
-        foreign_column_name = "id" if attempt is None else attempt
+        # The foreign table's primary key was already resolved when its own
+        #  schema was created, so the shared cache is reused here
+        foreign_column_name = self._get_primary_key(foreign_table_name)
 
         return ForeignKeySchema(column_name, foreign_table_name, foreign_column_name)
 
@@ -1,10 +1,75 @@
 """Stores the graph structure of the database schema"""
 
-import networkx
+import hashlib
+import json
+from collections import deque
+from functools import lru_cache
+from os import getenv
+from pathlib import Path
 from schematic_db.utils.api_utils import get_graph_by_edge_type
 from schematic_db.utils.types import DisplayLabelType
 
 
+def _get_graph_cache_path(
+    schema_url: str, display_label_type: DisplayLabelType
+) -> Path | None:
+    """Gets the on-disk cache path for a schema graph, if caching is enabled
+
+    Disk caching is opt in via the SCHEMATIC_DB_CACHE_DIR environment
+     variable. Entries are keyed by schema url, so the directory must be
+     cleared if the data model behind a url changes.
+
+    Args:
+        schema_url (str): The url of the schema in jsonld form.
+        display_label_type (DisplayLabelType): The type of display label used
+
+    Returns:
+        Path | None: The cache file path, or None when caching is disabled
+    """
+    cache_dir = getenv("SCHEMATIC_DB_CACHE_DIR")
+    if not cache_dir:
+        return None
+    key = hashlib.sha256(f"{schema_url};{display_label_type}".encode()).hexdigest()
+    return Path(cache_dir) / f"schema_graph_{key}.json"
+
+
+@lru_cache(maxsize=None)
+def _build_schema_graph(
+    schema_url: str, display_label_type: DisplayLabelType
+) -> dict[str, list[str]]:
+    """Builds the adjacency dict for a schema, memoized per schema url
+
+    Several classes each create their own SchemaGraph for the same schema;
+     the memoization means the edges are fetched and assembled only once.
+     The returned dict is shared, so callers must treat it as read only.
+     If SCHEMATIC_DB_CACHE_DIR is set the graph also persists to disk so
+     repeated short-lived runs skip the edge fetch entirely.
+
+    Args:
+        schema_url (str): The url of the schema in jsonld form.
+        display_label_type (DisplayLabelType): The type of display label used
+
+    Returns:
+        dict[str, list[str]]: Maps each table to the tables it depends on
+    """
+    cache_path = _get_graph_cache_path(schema_url, display_label_type)
+    if cache_path is not None and cache_path.exists():
+        with open(cache_path, encoding="utf-8") as file:
+            return json.load(file)
+    subgraph = get_graph_by_edge_type(
+        schema_url, "requiresComponent", display_label_type
+    )
+    schema_graph: dict[str, list[str]] = {}
+    for table_name, neighbor in subgraph:
+        schema_graph.setdefault(table_name, []).append(neighbor)
+        schema_graph.setdefault(neighbor, [])
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump(schema_graph, file)
+    return schema_graph
+
+
 class SchemaGraph:
     """
     Stores the graph structure of the database schema
@@ -20,20 +85,32 @@ class SchemaGraph:
         """
         self.schema_url = schema_url
         self.display_label_type = display_label_type
-        self.schema_graph = self.create_schema_graph()
+        # the graph is built lazily so that constructing a SchemaGraph (and
+        #  the classes that hold one) doesn't trigger the edge fetch
+        self._schema_graph: dict[str, list[str]] | None = None
+        self._sorted_table_names: list[str] | None = None
 
-    def create_schema_graph(self) -> networkx.DiGraph:
-        """Retrieve the edges from schematic API and store in networkx.DiGraph()
+    @property
+    def schema_graph(self) -> dict[str, list[str]]:
+        """The adjacency dict, built on first access
 
         Returns:
-            networkx.DiGraph: The edges of the graph
+            dict[str, list[str]]: Maps each table to the tables it depends on
         """
-        subgraph = get_graph_by_edge_type(
-            self.schema_url, "requiresComponent", self.display_label_type
-        )
-        schema_graph = networkx.DiGraph()
-        schema_graph.add_edges_from(subgraph)
-        return schema_graph
+        if self._schema_graph is None:
+            self._schema_graph = self.create_schema_graph()
+        return self._schema_graph
+
+    def create_schema_graph(self) -> dict[str, list[str]]:
+        """Retrieve the edges from schematic API and store as an adjacency dict
+
+        A plain dict is used instead of a networkx graph since the graph is
+         only needed for neighbor lookups and a topological sort.
+
+        Returns:
+            dict[str, list[str]]: Maps each table to the tables it depends on
+        """
+        return _build_schema_graph(self.schema_url, self.display_label_type)
 
     def create_sorted_table_name_list(self) -> list[str]:
         """
@@ -44,7 +121,47 @@ class SchemaGraph:
         Returns:
             list[str]: A list of table names
         """
-        return list(reversed(list(networkx.topological_sort(self.schema_graph))))
+        # the graph is immutable after init, so the sort is computed only once
+        if self._sorted_table_names is None:
+            sorted_names = self._topological_sort()
+            # reversed in place instead of materializing a second list
+            sorted_names.reverse()
+            self._sorted_table_names = sorted_names
+        return self._sorted_table_names
+
+    def _topological_sort(self) -> list[str]:
+        """Sorts the tables in the schema graph using Kahn's algorithm, so that
+         each table comes before the tables it depends on.
+
+        Returns:
+            list[str]: A list of table names
+
+        Raises:
+            ValueError: If the schema graph contains a dependency cycle
+        """
+        in_degree = {table_name: 0 for table_name in self.schema_graph}
+        for neighbors in self.schema_graph.values():
+            for neighbor in neighbors:
+                in_degree[neighbor] += 1
+        queue = deque(
+            table_name for table_name, degree in in_degree.items() if degree == 0
+        )
+        sorted_names = []
+        while queue:
+            table_name = queue.popleft()
+            sorted_names.append(table_name)
+            for neighbor in self.schema_graph[table_name]:
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+        # tables in a cycle never reach an in degree of zero, so they would
+        #  otherwise be silently dropped from the sorted list
+        if len(sorted_names) != len(self.schema_graph):
+            cyclic_tables = sorted(set(self.schema_graph) - set(sorted_names))
+            raise ValueError(
+                f"Schema graph contains a dependency cycle involving: {cyclic_tables}"
+            )
+        return sorted_names
 
     def get_neighbors(self, table_name: str) -> list[str]:
         """Gets the neighbors of the table in the schema graph
@@ -55,4 +172,4 @@ class SchemaGraph:
         Returns:
             list[str]: A list of other tables
         """
-        return list(self.schema_graph.neighbors(table_name))
+        return list(self.schema_graph.get(table_name, []))
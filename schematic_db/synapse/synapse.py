@@ -3,9 +3,77 @@
 from typing import Any
 import os
 from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
+from functools import lru_cache
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_exponential,
+    wait_random,
+)
+import requests
 import synapseclient  # type: ignore
 import pandas  # type: ignore
+from schematic_db.utils.dataframe_utils import split_table_into_chunks
+
+# A shared retry policy for Synapse schema and row mutations.
+# Exponential backoff with jitter spreads retries out under throttling where
+#  fixed one second waits cluster and re-trigger it; the stop conditions bound
+#  the worst case to 8 attempts or 60 seconds of waiting, whichever is first.
+synapse_retry = retry(
+    stop=stop_after_attempt(8) | stop_after_delay(60),
+    wait=wait_exponential(multiplier=0.5, max=10) + wait_random(0, 1),
+    retry=retry_if_exception_type(
+        (
+            synapseclient.core.exceptions.SynapseHTTPError,
+            requests.ConnectionError,
+            requests.Timeout,
+        )
+    ),
+)
+
+
+@lru_cache(maxsize=None)
+def _get_logged_in_client(auth_token: str) -> synapseclient.Synapse:
+    """Logs in a synapseclient client, once per token
+
+    Args:
+        auth_token (str): A Synapse auth_token
+
+    Returns:
+        synapseclient.Synapse: A logged in client
+    """
+    syn = synapseclient.Synapse()
+    syn.login(authToken=auth_token, silent=True)
+    return syn
+
+
+@lru_cache(maxsize=None)
+def _create_synapse_client(
+    auth_token: str, cache_root_dir: str | None
+) -> synapseclient.Synapse:
+    """Creates a synapseclient client, shared per token and cache dir
+
+    Several classes each wrap their own Synapse object; memoizing the client
+     means the login handshake happens once per credential instead of once
+     per wrapper. Clients that differ only by cache directory reuse the
+     already validated credentials instead of authenticating again.
+
+    Args:
+        auth_token (str): A Synapse auth_token
+        cache_root_dir (str | None): Where the directory of the synapse cache
+         should be located
+
+    Returns:
+        synapseclient.Synapse: A logged in client
+    """
+    base = _get_logged_in_client(auth_token)
+    if cache_root_dir is None:
+        return base
+    syn = synapseclient.Synapse(cache_root_dir=cache_root_dir)
+    syn.credentials = base.credentials
+    return syn
 
 
 class SynapseTableNameError(Exception):
@@ -60,9 +128,12 @@ class Synapse:  # pylint: disable=too-many-public-methods
             cache_root_dir( str | None): Where the directory of the synapse cache should be located
         """
         self.project_id = project_id
-        syn = synapseclient.Synapse(cache_root_dir=cache_root_dir)
-        syn.login(authToken=auth_token, silent=True)
-        self.syn = syn
+        self.syn = _create_synapse_client(auth_token, cache_root_dir)
+        self._project: synapseclient.Entity | None = None
+        self._table_data: list[dict[str, Any]] | None = None
+        self._table_id_map: dict[str, list[str]] | None = None
+        self._table_name_map: dict[str, str] | None = None
+        self._column_cache: dict[str, list[synapseclient.Column]] = {}
 
     def purge_cache(self) -> None:
         """purges the synapse cache"""
@@ -73,19 +144,35 @@ class Synapse:  # pylint: disable=too-many-public-methods
         return sum([f for _, _, f in os.walk(self.syn.cache.cache_root_dir)], [])
 
     def download_csv_as_dataframe(
-        self, synapse_id: str, purge_cache: bool = False
+        self,
+        synapse_id: str,
+        purge_cache: bool = False,
+        usecols: list[str] | None = None,
     ) -> pandas.DataFrame:
         """Downloads a csv file form Synapse and reads it
 
         Args:
             synapse_id (str): The Synapse id of the file
             purge_cache (bool): If true the synapse cache is purged after downloading
+            usecols (list[str] | None): If given, only these columns are parsed;
+             columns in the list but not in the file are ignored.
 
         Returns:
             pandas.DataFrame: The file in dataframe form
         """
         entity = self.syn.get(synapse_id)
-        df = pandas.read_csv(entity.path, keep_default_na=False, na_values="")
+        if usecols is not None:
+            # a callable tolerates columns in the list that are absent from
+            #  the file, where a plain list would raise
+            wanted = set(usecols)
+            df = pandas.read_csv(
+                entity.path,
+                keep_default_na=False,
+                na_values="",
+                usecols=lambda column: column in wanted,
+            )
+        else:
+            df = pandas.read_csv(entity.path, keep_default_na=False, na_values="")
         if purge_cache:
             self.purge_cache()
         return df
@@ -102,11 +189,28 @@ class Synapse:  # pylint: disable=too-many-public-methods
     def _get_table_data(self) -> list[dict[str, Any]]:
         """Gets the list of Synapse table entities for the project
 
+        The listing is cached since it costs two REST calls and several
+         methods need it; methods that create or delete tables clear the
+         cache.
+
         Returns:
             list[dict[str, Any]]: A list of all Synapse tables as dicts
         """
-        project = self.syn.get(self.project_id)
-        return list(self.syn.getChildren(project, includeTypes=["table"]))
+        if self._table_data is None:
+            self._table_data = list(
+                self.syn.getChildren(self._get_project(), includeTypes=["table"])
+            )
+        return self._table_data
+
+    def _get_project(self) -> synapseclient.Entity:
+        """Gets the project entity, fetched once and cached
+
+        Returns:
+            synapseclient.Entity: The project the class is set up with
+        """
+        if self._project is None:
+            self._project = self.syn.get(self.project_id)
+        return self._project
 
     def get_table_column_names(self, table_name: str) -> list[str]:
         """Gets the column names from a synapse table
@@ -118,9 +222,33 @@ class Synapse:  # pylint: disable=too-many-public-methods
             list[str]: A list of column names
         """
         synapse_id = self.get_synapse_id_from_table_name(table_name)
-        table = self.syn.get(synapse_id)
-        columns = list(self.syn.getTableColumns(table))
-        return [column.name for column in columns]
+        return [column.name for column in self._get_columns(synapse_id)]
+
+    def _get_columns(self, synapse_id: str) -> list[synapseclient.Column]:
+        """Gets the columns of a Synapse table, cached per table
+
+        The cache is cleared for a table whenever its columns are mutated.
+        getTableColumns accepts a synapse id, so no entity fetch is needed.
+
+        Args:
+            synapse_id (str): The Synapse id of the table
+
+        Returns:
+            list[synapseclient.Column]: The table's current columns
+        """
+        columns = self._column_cache.get(synapse_id)
+        if columns is None:
+            columns = list(self.syn.getTableColumns(synapse_id))
+            self._column_cache[synapse_id] = columns
+        return columns
+
+    def _invalidate_column_cache(self, synapse_id: str) -> None:
+        """Clears the cached columns for a Synapse table
+
+        Args:
+            synapse_id (str): The Synapse id of the table
+        """
+        self._column_cache.pop(synapse_id, None)
 
     def get_synapse_id_from_table_name(self, table_name: str) -> str:
         """Gets the synapse id from the table name
@@ -135,15 +263,35 @@ class Synapse:  # pylint: disable=too-many-public-methods
         Returns:
             str: A synapse id
         """
-        tables = self._get_table_data()
-        matching_tables = [table for table in tables if table["name"] == table_name]
-        if len(matching_tables) == 0:
+        matching_ids = self._get_table_id_map().get(table_name, [])
+        if len(matching_ids) == 0:
             raise SynapseTableNameError("No matching tables with name:", table_name)
-        if len(matching_tables) > 1:
+        if len(matching_ids) > 1:
             raise SynapseTableNameError(
                 "Multiple matching tables with name:", table_name
             )
-        return matching_tables[0]["id"]
+        return matching_ids[0]
+
+    def _get_table_id_map(self) -> dict[str, list[str]]:
+        """Gets a map from table name to Synapse table ids with that name.
+        The map is cached so resolving several table names costs one listing call;
+         methods that create or delete tables clear the cache.
+
+        Returns:
+            dict[str, list[str]]: A map from table name to Synapse table ids
+        """
+        if self._table_id_map is None:
+            table_id_map: dict[str, list[str]] = {}
+            for table in self._get_table_data():
+                table_id_map.setdefault(table["name"], []).append(table["id"])
+            self._table_id_map = table_id_map
+        return self._table_id_map
+
+    def _invalidate_table_id_map(self) -> None:
+        """Clears the cached table listing and the name and id maps"""
+        self._table_data = None
+        self._table_id_map = None
+        self._table_name_map = None
 
     def get_table_name_from_synapse_id(self, synapse_id: str) -> str:
         """Gets the table name from the synapse id
@@ -154,8 +302,11 @@ class Synapse:  # pylint: disable=too-many-public-methods
         Returns:
             str: The name of the table with the synapse id
         """
-        tables = self._get_table_data()
-        return [table["name"] for table in tables if table["id"] == synapse_id][0]
+        if self._table_name_map is None:
+            self._table_name_map = {
+                table["id"]: table["name"] for table in self._get_table_data()
+            }
+        return self._table_name_map[synapse_id]
 
     def query_table(
         self, synapse_id: str, include_row_data: bool = False
@@ -185,7 +336,10 @@ class Synapse:  # pylint: disable=too-many-public-methods
             pandas.DataFrame: The queried table
         """
         result = self.execute_sql_statement(query, include_row_data)
-        table = pandas.read_csv(result.filepath)
+        # asDataFrame parses the downloaded csv with the column types Synapse
+        #  reports instead of re-inferring them from a second read_csv pass;
+        #  row id and version stay as columns rather than moving to the index
+        table = result.asDataFrame(rowIdAndVersionInIndex=False)
         return table
 
     def execute_sql_statement(
@@ -214,10 +368,11 @@ class Synapse:  # pylint: disable=too-many-public-methods
             table_name (str): The name fo the table
             table (pandas.DataFrame): A dataframe of the table
         """
-        table_copy = table.copy(deep=False)
-        project = self.syn.get(self.project_id)
-        table_copy = synapseclient.table.build_table(table_name, project, table_copy)
-        self.syn.store(table_copy)
+        synapse_table = synapseclient.table.build_table(
+            table_name, self._get_project(), table
+        )
+        self.syn.store(synapse_table)
+        self._invalidate_table_id_map()
 
     def add_table(self, table_name: str, columns: list[synapseclient.Column]) -> None:
         """Adds a synapse table
@@ -226,13 +381,13 @@ class Synapse:  # pylint: disable=too-many-public-methods
             table_name (str): The name of the table to be added
             columns (list[synapseclient.Column]): The columns to be added
         """
-        # create a dictionary with a key for every column, and value of an empty list
-        values: dict[str, list] = {column.name: [] for column in columns}
         schema = synapseclient.Schema(
             name=table_name, columns=columns, parent=self.project_id
         )
-        table = synapseclient.Table(schema, values)
-        self.syn.store(table)
+        # storing the schema alone creates the empty table; building a Table
+        #  from per-column empty lists just to upload a rowless csv is skipped
+        self.syn.store(schema)
+        self._invalidate_table_id_map()
 
     def delete_table(self, synapse_id: str) -> None:
         """Deletes a Synapse table
@@ -240,6 +395,8 @@ class Synapse:  # pylint: disable=too-many-public-methods
             synapse_id (str): The Synapse id of the table to delete
         """
         self.syn.delete(synapse_id)
+        self._invalidate_table_id_map()
+        self._invalidate_column_cache(synapse_id)
 
     def replace_table(self, table_name: str, table: pandas.DataFrame) -> None:
         """
@@ -250,24 +407,68 @@ class Synapse:  # pylint: disable=too-many-public-methods
             table_name (str): The name of the table to be replaced
             table (pandas.DataFrame): A dataframe of the table to replace to old table with
         """
-        if table_name not in self.get_table_names():
+        # a dict membership test on the cached id map instead of building
+        #  the name list and scanning it
+        if table_name not in self._get_table_id_map():
             self.build_table(table_name, table)
         else:
             synapse_id = self.get_synapse_id_from_table_name(table_name)
 
-            self.delete_all_table_rows(synapse_id)
-            self.delete_all_table_columns(synapse_id)
-            self.add_table_columns(synapse_id, synapseclient.as_table_columns(table))
+            # the current column list is fetched once and shared by the row
+            #  deletion and column replacement steps below
+            old_columns = self._get_columns(synapse_id)
+            self._delete_all_table_rows(synapse_id, old_columns)
+            # the old columns are removed and the new ones added in a single
+            #  schema store instead of one round trip per phase
+            self._replace_table_columns(
+                synapse_id, old_columns, synapseclient.as_table_columns(table)
+            )
             self.insert_table_rows(synapse_id, table)
 
-    def insert_table_rows(self, synapse_id: str, data: pandas.DataFrame) -> None:
+    @synapse_retry
+    def _replace_table_columns(
+        self,
+        synapse_id: str,
+        old_columns: list[synapseclient.Column],
+        new_columns: list[synapseclient.Column],
+    ) -> None:
+        """Replaces the given columns in the Synapse table with the new ones
+
+        The table entity is fetched inside the retried body so every attempt
+         starts from an unmutated schema object.
+
+        Args:
+            synapse_id (str): The Synapse id of the table
+            old_columns (list[synapseclient.Column]): The table's current columns
+            new_columns (list[synapseclient.Column]): The columns to replace
+             the current ones with
+        """
+        table = self.syn.get(synapse_id)
+        for col in old_columns:
+            table.removeColumn(col)
+        for col in new_columns:
+            table.addColumn(col)
+        self.syn.store(table)
+        self._invalidate_column_cache(synapse_id)
+
+    def insert_table_rows(
+        self, synapse_id: str, data: pandas.DataFrame, chunk_size: int | None = 10_000
+    ) -> None:
         """Insert table rows into Synapse table
         Args:
             synapse_id (str): The Synapse id of the table to add rows into
             data (pandas.DataFrame): The rows to be added.
+            chunk_size (int | None): How many rows to upload per store call;
+             this caps the size of the csv synapseclient serializes for each
+             upload. If None the whole frame is uploaded at once.
         """
-        table = self.syn.get(synapse_id)
-        self.syn.store(synapseclient.Table(table, data))
+        if chunk_size is None or len(data.index) <= chunk_size:
+            # storing against the id directly uploads the rows as one CSV
+            self.syn.store(synapseclient.Table(synapse_id, data))
+            return
+        # the chunks are views of the input frame, so this doesn't copy the data
+        for chunk in split_table_into_chunks(data, chunk_size):
+            self.syn.store(synapseclient.Table(synapse_id, chunk))
 
     def upsert_table_rows(self, synapse_id: str, data: pandas.DataFrame) -> None:
         """Upserts rows from  the given table
@@ -301,28 +502,38 @@ class Synapse:  # pylint: disable=too-many-public-methods
             )
         self.syn.delete(synapseclient.Table(synapse_id, data))
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(1),
-        retry=retry_if_exception_type(synapseclient.core.exceptions.SynapseHTTPError),
-    )
     def delete_all_table_rows(self, synapse_id: str) -> None:
         """Deletes all rows in the Synapse table
 
         Args:
             synapse_id (str): The Synapse id of the table
         """
-        table = self.syn.get(synapse_id)
-        columns = self.syn.getTableColumns(table)
-        if len(list(columns)) > 0:
-            results = self.syn.tableQuery(f"select * from {synapse_id}")
+        self._delete_all_table_rows(synapse_id, self._get_columns(synapse_id))
+
+    @synapse_retry
+    def _delete_all_table_rows(
+        self, synapse_id: str, columns: list[synapseclient.Column]
+    ) -> None:
+        """Deletes all rows in the Synapse table given its current columns
+
+        Args:
+            synapse_id (str): The Synapse id of the table
+            columns (list[synapseclient.Column]): The table's current columns
+        """
+        if len(columns) == 0:
+            return
+        # querying a single column still yields the row ids and versions
+        #  needed for the delete, without downloading the whole table
+        results = self.syn.tableQuery(f'select "{columns[0].name}" from {synapse_id}')
+        # the result csv holds only a header when the table is empty;
+        #  skip the delete round trip in that case
+        with open(results.filepath, encoding="utf-8") as file:
+            file.readline()
+            has_rows = bool(file.readline())
+        if has_rows:
             self.syn.delete(results)
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(1),
-        retry=retry_if_exception_type(synapseclient.core.exceptions.SynapseHTTPError),
-    )
+    @synapse_retry
     def delete_all_table_columns(self, synapse_id: str) -> None:
         """Deletes all columns in the Synapse table
 
@@ -334,12 +545,9 @@ class Synapse:  # pylint: disable=too-many-public-methods
         for col in columns:
             table.removeColumn(col)
         self.syn.store(table)
+        self._invalidate_column_cache(synapse_id)
 
-    @retry(
-        stop=stop_after_attempt(5),
-        wait=wait_fixed(1),
-        retry=retry_if_exception_type(synapseclient.core.exceptions.SynapseHTTPError),
-    )
+    @synapse_retry
     def add_table_columns(
         self, synapse_id: str, columns: list[synapseclient.Column]
     ) -> None:
@@ -353,6 +561,7 @@ class Synapse:  # pylint: disable=too-many-public-methods
         for col in columns:
             table.addColumn(col)
         self.syn.store(table)
+        self._invalidate_column_cache(synapse_id)
 
     def get_entity_annotations(self, synapse_id: str) -> synapseclient.Annotations:
         """Gets the annotations for the Synapse entity
@@ -376,8 +585,8 @@ class Synapse:  # pylint: disable=too-many-public-methods
         """
         entity_annotations = self.syn.get_annotations(synapse_id)
         entity_annotations.clear()
-        for key, value in annotations.items():
-            entity_annotations[key] = value
+        # one C level merge instead of a per key assignment loop
+        entity_annotations.update(annotations)
         self.syn.set_annotations(entity_annotations)
 
     def clear_entity_annotations(self, synapse_id: str) -> None:
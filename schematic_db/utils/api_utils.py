@@ -2,15 +2,21 @@
 
 # pylint: disable=duplicate-code
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from functools import lru_cache
 from os import getenv
 from datetime import datetime
 import pytz
 import requests
-import pandas
+import requests.adapters
 from schematic_db.manifest_store.manifest_metadata_list import ManifestMetadataList
 from schematic_db.utils.types import DisplayLabelType
 
+if TYPE_CHECKING:
+    import pandas
+
 
 class SchematicAPIError(Exception):
     """When schematic API response status code is anything other than 200"""
@@ -88,6 +94,15 @@ class SchematicAPITimeoutError(Exception):
         )
 
 
+# a shared session so concurrent callers reuse keep-alive connections
+#  instead of opening a new one per request
+_session = requests.Session()
+_session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32),
+)
+
+
 def create_schematic_api_response(
     endpoint_path: str,
     params: dict[str, Any],
@@ -114,7 +129,7 @@ def create_schematic_api_response(
     start_time = datetime.now(pytz.timezone("US/Pacific"))
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        response = requests.get(
+        response = _session.get(
             endpoint_url, params=params, headers=headers, timeout=timeout
         )
     except requests.exceptions.Timeout as exc:
@@ -130,6 +145,7 @@ def create_schematic_api_response(
     return response
 
 
+@lru_cache(maxsize=None)
 def find_class_specific_properties(
     schema_url: str,
     schema_class: str,
@@ -156,6 +172,7 @@ def find_class_specific_properties(
     return response.json()
 
 
+@lru_cache(maxsize=4096)
 def get_property_label_from_display_name(
     display_name: str, strict_camel_case: bool = True
 ) -> str:
@@ -179,6 +196,7 @@ def get_property_label_from_display_name(
     return response.json()
 
 
+@lru_cache(maxsize=None)
 def get_graph_by_edge_type(
     schema_url: str,
     relationship: str,
@@ -250,6 +268,10 @@ def download_manifest(access_token: str, manifest_id: str) -> pandas.DataFrame:
     Returns:
         pd.DataFrame: The manifest in dataframe form
     """
+    # imported here so schema-only consumers of this module don't pay the
+    #  pandas import cost at startup
+    import pandas  # pylint: disable=import-outside-toplevel
+
     params = {
         "manifest_id": manifest_id,
         "as_json": True,
@@ -261,6 +283,7 @@ def download_manifest(access_token: str, manifest_id: str) -> pandas.DataFrame:
     return manifest
 
 
+@lru_cache(maxsize=8192)
 def is_node_required(
     schema_url: str,
     node_display_name: str,
@@ -286,6 +309,7 @@ def is_node_required(
     return response.json()
 
 
+@lru_cache(maxsize=None)
 def get_node_validation_rules(
     schema_url: str,
     node_display_name: str,
@@ -310,3 +334,15 @@ def get_node_validation_rules(
         "schemas/get_node_validation_rules", params
     )
     return response.json()
+
+
+def clear_schematic_api_caches() -> None:
+    """Clears the caches of the memoized schematic API functions
+
+    Should be called if the data model behind a schema url may have changed.
+    """
+    find_class_specific_properties.cache_clear()
+    get_property_label_from_display_name.cache_clear()
+    get_graph_by_edge_type.cache_clear()
+    is_node_required.cache_clear()
+    get_node_validation_rules.cache_clear()
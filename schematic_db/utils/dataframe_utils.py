@@ -31,4 +31,43 @@ def split_table_into_chunks(
         )
     n_rows = len(table.index)
     n_chunks = math.ceil(n_rows / chunk_size)
-    return np.array_split(table, n_chunks)
+    # splitting the row positions instead of the table itself means each chunk
+    # is a view of the input table, not a copy
+    row_chunks = np.array_split(np.arange(n_rows), n_chunks)
+    return [table.iloc[rows[0] : rows[-1] + 1] for rows in row_chunks]
+
+
+def concat_tables(tables: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates a list of dataframes into one dataframe.
+
+    When every table has identical columns with matching numpy dtypes, the
+    columns are stacked directly with np.concatenate, skipping pandas' block
+    alignment. Otherwise this falls back to pd.concat.
+
+    Args:
+        tables (list[pd.DataFrame]): The tables to be concatenated
+
+    Raises:
+        ValueError: If the input list is empty
+
+    Returns:
+        pd.DataFrame: The concatenated table with a fresh index
+    """
+    if not tables:
+        raise ValueError("Attempting to concatenate an empty list of tables")
+    if len(tables) == 1:
+        return tables[0].reset_index(drop=True)
+    first = tables[0]
+    homogeneous = all(isinstance(dtype, np.dtype) for dtype in first.dtypes) and all(
+        table.columns.equals(first.columns) and table.dtypes.equals(first.dtypes)
+        for table in tables[1:]
+    )
+    if not homogeneous:
+        return pd.concat(tables, ignore_index=True)
+    return pd.DataFrame(
+        {
+            column: np.concatenate([table[column].to_numpy() for table in tables])
+            for column in first.columns
+        }
+    )
@@ -1,12 +1,19 @@
 """Fixtures for all tests"""
 
 import os
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Generator, Any
 import pytest
 import pandas as pd
 import numpy as np
-from yaml import safe_load
+import yaml
+
+try:
+    # the libyaml backed loader parses much faster when it is available
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 import synapseclient as sc  # type: ignore
 from schematic_db.db_schema.db_schema import (
     DatabaseSchema,
@@ -41,6 +48,25 @@ SECRETS_PATH = os.path.join(DATA_DIR, "secrets.yml")
 # files -----------------------------------------------------------------------
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fixture_schema_graph_cache_dir(
+    request: pytest.FixtureRequest,
+) -> Generator[None, None, None]:
+    """
+    Points the schema graph disk cache at pytest's cache directory so repeat
+     runs skip the schema graph fetch; respects a caller-configured directory.
+    The entries are keyed by schema url, so clear .pytest_cache if a test
+     schema changes upstream.
+    """
+    original = os.environ.get("SCHEMATIC_DB_CACHE_DIR")
+    if original is None:
+        cache_dir = request.config.cache.mkdir("schematic_db")
+        os.environ["SCHEMATIC_DB_CACHE_DIR"] = str(cache_dir)
+    yield
+    if original is None:
+        del os.environ["SCHEMATIC_DB_CACHE_DIR"]
+
+
 @pytest.fixture(scope="session", name="data_directory")
 def fixture_data_directory() -> Generator[str, None, None]:
     """
@@ -49,21 +75,34 @@ def fixture_data_directory() -> Generator[str, None, None]:
     yield DATA_DIR
 
 
+@lru_cache(maxsize=None)
+def _load_secrets() -> dict[str, dict[str, str]]:
+    """Parses and validates secrets.yml, cached across fixture uses
+
+    Returns:
+        dict[str, dict[str, str]]: A dict with various secrets, either locally
+         or from a github action
+    """
+    with open(SECRETS_PATH, mode="rt", encoding="utf-8") as file:
+        # reading the whole file first hands the C parser one string instead
+        #  of a python level stream
+        config = yaml.load(file.read(), Loader=YamlLoader)
+    assert isinstance(config, dict)
+    for section, secrets in config.items():
+        assert isinstance(section, str)
+        assert isinstance(secrets, dict)
+        for secret_name, secret_value in secrets.items():
+            assert isinstance(secret_name, str)
+            assert isinstance(secret_value, str)
+    return config
+
+
 @pytest.fixture(scope="session", name="secrets_dict")
 def fixture_secrets_dict() -> Generator[dict[str, dict[str, str]], None, None]:
     """
     Yields a dict with various secrets, either locally or from a github action
     """
-    with open(SECRETS_PATH, mode="rt", encoding="utf-8") as file:
-        config = safe_load(file)
-    assert isinstance(config, dict)
-    for key, value in config.items():
-        assert isinstance(key, str)
-        assert isinstance(value, dict)
-        for key, value in value.items():
-            assert isinstance(key, str)
-            assert isinstance(value, str)
-    yield config
+    yield _load_secrets()
 
 
 @pytest.fixture(scope="session", name="query_csv_path")
@@ -77,33 +116,46 @@ def fixture_query_csv_path() -> Generator[str, None, None]:
 # objects involving the main schematic test schema
 
 
+# constant values shared by the fixtures below; the fixtures just yield them
+#  so fixture resolution does no construction work
+TEST_SCHEMA_TABLE_NAMES = [
+    "Biospecimen",
+    "BulkRnaSeq",
+    "Patient",
+]
+
+TEST_SCHEMA_CSV_URL = (
+    "https://raw.githubusercontent.com/Sage-Bionetworks/"
+    "Schematic-DB-Test-Schemas/main/test_schema.csv"
+)
+
+TEST_SCHEMA_JSON_URL = (
+    "https://raw.githubusercontent.com/Sage-Bionetworks/"
+    "Schematic-DB-Test-Schemas/main/test_schema.jsonld"
+)
+
+TEST_SCHEMA_DISPLAY_NAME_JSON_URL = (
+    "https://raw.githubusercontent.com/Sage-Bionetworks/"
+    "Schematic-DB-Test-Schemas/main/test_schema_display_label.jsonld"
+)
+
+TEST_SYNAPSE_PROJECT_ID = "syn47994571"
+
+TEST_SYNAPSE_ASSET_VIEW_ID = "syn47997084"
+
+
 @pytest.fixture(scope="session", name="test_schema_table_names")
 def fixture_test_schema_table_names() -> Generator[list[str], None, None]:
     """
     Yields a list of table names the test schema database should have.
     """
-    table_names = [
-        "Biospecimen",
-        "BulkRnaSeq",
-        "Patient",
-    ]
-    yield table_names
+    yield TEST_SCHEMA_TABLE_NAMES
 
 
 @pytest.fixture(scope="session", name="test_schema_csv_url")
 def fixture_test_schema_csv_url() -> Generator[str, None, None]:
     """Yields the url for the main test schema json"""
-    url = (
-        "https://raw.githubusercontent.com/Sage-Bionetworks/"
-        "Schematic-DB-Test-Schemas/main/test_schema.csv"
-    )
-    yield url
-
-
-TEST_SCHEMA_JSON_URL = (
-    "https://raw.githubusercontent.com/Sage-Bionetworks/"
-    "Schematic-DB-Test-Schemas/main/test_schema.jsonld"
-)
+    yield TEST_SCHEMA_CSV_URL
 
 
 @pytest.fixture(scope="session", name="test_schema_json_url")
@@ -115,11 +167,7 @@ def fixture_test_schema_json_url() -> Generator[str, None, None]:
 @pytest.fixture(scope="session", name="test_schema_display_name_json_url")
 def fixture_test_schema_display_name_json_url() -> Generator[str, None, None]:
     """Yields the url for the main test schema json"""
-    url = (
-        "https://raw.githubusercontent.com/Sage-Bionetworks/"
-        "Schematic-DB-Test-Schemas/main/test_schema_display_label.jsonld"
-    )
-    yield url
+    yield TEST_SCHEMA_DISPLAY_NAME_JSON_URL
 
 
 @pytest.fixture(scope="session", name="mysql_config")
@@ -209,13 +257,13 @@ def fixture_synapse_database(
 @pytest.fixture(scope="session", name="test_synapse_project_id")
 def fixture_test_synapse_project_id() -> Generator[str, None, None]:
     """Yields the synapse id for the test schema project id"""
-    yield "syn47994571"
+    yield TEST_SYNAPSE_PROJECT_ID
 
 
 @pytest.fixture(scope="session", name="test_synapse_asset_view_id")
 def fixture_test_synapse_asset_view_id() -> Generator[str, None, None]:
     """Yields the synapse id for the test schema asset view"""
-    yield "syn47997084"
+    yield TEST_SYNAPSE_ASSET_VIEW_ID
 
 
 @pytest.fixture(scope="session", name="schema_generator1")
@@ -231,16 +279,14 @@ def fixture_schema_generator1(
     yield obj
 
 
-@pytest.fixture(scope="session", name="schema_generator2")
-def fixture_schema_generator2(
-    test_schema_csv_url: str,
-) -> Generator[SchemaGenerator, None, None]:
-    """
-    Yields a SchemaGenerator using the database specific test schema.
-    This uses a database config
+@lru_cache(maxsize=None)
+def _build_schema_generator2_database_config() -> DatabaseConfig:
+    """Builds the database config used by schema_generator2, validated once
+
+    Returns:
+        DatabaseConfig: A database config for the test schema
     """
-    config = SchemaGeneratorConfig(test_schema_csv_url)
-    database_config = DatabaseConfig(
+    return DatabaseConfig(
         [
             {
                 "name": "Patient",
@@ -267,7 +313,20 @@ def fixture_schema_generator2(
             },
         ]
     )
-    obj = SchemaGenerator(config, database_config=database_config)
+
+
+@pytest.fixture(scope="session", name="schema_generator2")
+def fixture_schema_generator2(
+    test_schema_csv_url: str,
+) -> Generator[SchemaGenerator, None, None]:
+    """
+    Yields a SchemaGenerator using the database specific test schema.
+    This uses a database config
+    """
+    config = SchemaGeneratorConfig(test_schema_csv_url)
+    obj = SchemaGenerator(
+        config, database_config=_build_schema_generator2_database_config()
+    )
     yield obj
 
 
@@ -326,14 +385,14 @@ def fixture_synapse_test_query_store(
 # config objects and pandas dataframes
 
 
-@pytest.fixture(scope="module", name="db_queryer_mysql")
+@pytest.fixture(scope="session", name="db_queryer_mysql")
 def fixture_db_queryer_mysql(
-    mysql: MySQLDatabase, synapse_query_store: QueryStore
+    mysql_database: MySQLDatabase, synapse_test_query_store: QueryStore
 ) -> Generator[DBQueryer, None, None]:
     """Yields a RDBQueryer"""
     obj = DBQueryer(
-        db=mysql,
-        query_store=synapse_query_store,
+        db=mysql_database,
+        query_store=synapse_test_query_store,
     )
     yield obj
 
@@ -343,40 +402,34 @@ def fixture_table_one() -> Generator[pd.DataFrame, None, None]:
     """
     Yields a pd.Dataframe.
     """
+    # the nullable columns are built with their final dtypes directly, so no
+    #  astype or to_datetime re-cast pass is needed afterwards
     dataframe = pd.DataFrame(
         {
             "pk_one_col": ["key1", "key2", "key3"],
             "text_one_col": ["a", "b", np.nan],
-            "int_one_col": [1, pd.NA, 3],
+            "int_one_col": pd.array([1, pd.NA, 3], dtype="Int64"),
             "double_one_col": [1.1, 2.2, np.nan],
-            "date_one_col": [datetime(2022, 8, 2), np.nan, datetime(2022, 8, 2)],
-            "bool_one_col": [pd.NA, True, False],
+            "date_one_col": pd.Series(
+                [date(2022, 8, 2), pd.NaT, date(2022, 8, 2)], dtype="object"
+            ),
+            "bool_one_col": pd.array([pd.NA, True, False], dtype="boolean"),
         }
     )
-    dataframe = dataframe.astype({"int_one_col": "Int64", "bool_one_col": "boolean"})
-    dataframe["date_one_col"] = pd.to_datetime(dataframe["date_one_col"]).dt.date
     yield dataframe
 
 
 @pytest.fixture(scope="session", name="synapse_table_one")
-def fixture_synapse_table_one() -> Generator[pd.DataFrame, None, None]:
+def fixture_synapse_table_one(
+    table_one: pd.DataFrame,
+) -> Generator[pd.DataFrame, None, None]:
     """
-    Yields a pd.Dataframe.
+    Yields a pd.Dataframe; table_one extended with Synapse specific columns
     """
-    dataframe = pd.DataFrame(
-        {
-            "pk_one_col": ["key1", "key2", "key3"],
-            "text_one_col": ["a", "b", np.nan],
-            "int_one_col": [1, pd.NA, 3],
-            "double_one_col": [1.1, 2.2, np.nan],
-            "date_one_col": [datetime(2022, 8, 2), np.nan, datetime(2022, 8, 2)],
-            "bool_one_col": [pd.NA, True, False],
-            "string_one_col": ["a", "b", np.nan],
-            "string_list_one_col": ["[a,b,c]", "[d,f]", np.nan],
-        }
+    dataframe = table_one.assign(
+        string_one_col=["a", "b", np.nan],
+        string_list_one_col=["[a,b,c]", "[d,f]", np.nan],
     )
-    dataframe = dataframe.astype({"int_one_col": "Int64", "bool_one_col": "boolean"})
-    dataframe["date_one_col"] = pd.to_datetime(dataframe["date_one_col"]).dt.date
     yield dataframe
 
 
@@ -420,37 +473,17 @@ def fixture_table_one_schema() -> Generator[TableSchema, None, None]:
 
 
 @pytest.fixture(scope="session", name="synapse_table_one_schema")
-def fixture_synapse_table_one_schema() -> Generator[TableSchema, None, None]:
+def fixture_synapse_table_one_schema(
+    table_one_schema: TableSchema,
+) -> Generator[TableSchema, None, None]:
     """
-    Yields a TableSchema object with one primary and no foreign keys
+    Yields a TableSchema object; table_one_schema extended with Synapse
+     specific columns
     """
     schema = TableSchema(
         name="table_one",
-        columns=[
-            ColumnSchema(
-                name="pk_one_col",
-                datatype=ColumnDatatype.TEXT,
-                required=True,
-                index=True,
-            ),
-            ColumnSchema(
-                name="text_one_col",
-                datatype=ColumnDatatype.TEXT,
-                required=False,
-                index=True,
-            ),
-            ColumnSchema(
-                name="int_one_col", datatype=ColumnDatatype.INT, required=False
-            ),
-            ColumnSchema(
-                name="double_one_col", datatype=ColumnDatatype.FLOAT, required=False
-            ),
-            ColumnSchema(
-                name="date_one_col", datatype=ColumnDatatype.DATE, required=False
-            ),
-            ColumnSchema(
-                name="bool_one_col", datatype=ColumnDatatype.BOOLEAN, required=False
-            ),
+        columns=table_one_schema.columns
+        + [
             ColumnSchema(
                 name="string_one_col",
                 datatype=ColumnDatatype.SYNAPSE_STRING,
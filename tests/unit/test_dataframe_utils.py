@@ -3,7 +3,7 @@
 import pytest
 import pandas as pd
 from pandas.testing import assert_frame_equal
-from schematic_db.utils.dataframe_utils import split_table_into_chunks
+from schematic_db.utils.dataframe_utils import split_table_into_chunks, concat_tables
 
 
 class TestSplitTableIntoChunks:  # pylint: disable=too-few-public-methods
@@ -51,3 +51,38 @@ class TestSplitTableIntoChunks:  # pylint: disable=too-few-public-methods
             match="Attempting to split input table using chunk size bewlow 1",
         ):
             split_table_into_chunks(pd.DataFrame({"col1": ["A", "B", "C"]}), 0)
+
+
+class TestConcatTables:
+    """Testing for concat_tables"""
+
+    def test_success1(self) -> None:
+        """Testing for successful concat of matching tables"""
+        table1 = pd.DataFrame({"col1": ["A", "B"], "col2": [1, 2]})
+        table2 = pd.DataFrame({"col1": ["C", "D"], "col2": [3, 4]})
+        result = concat_tables([table1, table2])
+        assert_frame_equal(
+            result,
+            pd.DataFrame({"col1": ["A", "B", "C", "D"], "col2": [1, 2, 3, 4]}),
+        )
+
+    def test_success2(self) -> None:
+        """Testing for successful concat of tables with differing columns"""
+        table1 = pd.DataFrame({"col1": ["A", "B"]})
+        table2 = pd.DataFrame({"col2": [1, 2]})
+        result = concat_tables([table1, table2])
+        assert_frame_equal(result, pd.concat([table1, table2], ignore_index=True))
+
+    def test_success3(self) -> None:
+        """Testing for successful concat of a single table"""
+        table = pd.DataFrame({"col1": ["A", "B"]}, index=[5, 6])
+        result = concat_tables([table])
+        assert_frame_equal(result, table.reset_index(drop=True))
+
+    def test_error(self) -> None:
+        """Testing for value error when input list is empty"""
+        with pytest.raises(
+            ValueError,
+            match="Attempting to concatenate an empty list of tables",
+        ):
+            concat_tables([])
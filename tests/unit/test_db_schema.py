@@ -52,8 +52,8 @@ class TestColumnSchema:  # pylint: disable= too-few-public-methods
     """Testing for ColumnSchema"""
 
     def test_validation_error(self) -> None:
-        """Testing for ForeignKeySchema pydantic error"""
-        with pytest.raises(ValidationError):
+        """Testing for ColumnSchema error when the name is empty"""
+        with pytest.raises(ValueError):
             ColumnSchema(name="", datatype=ColumnDatatype.TEXT)
 
 
@@ -62,8 +62,8 @@ class TestForeignKeySchema:
     """Testing for ForeignKeySchema"""
 
     def test_validation_error(self) -> None:
-        """Testing for ForeignKeySchema pydantic error"""
-        with pytest.raises(ValidationError):
+        """Testing for ForeignKeySchema error when the name is empty"""
+        with pytest.raises(ValueError):
             ForeignKeySchema(
                 name="",
                 foreign_table_name="test_object",